@@ -10,10 +10,45 @@ Main components:
 - analysis: Data analysis and visualization utilities
 - utils: Helper functions and utilities
 - config: Configuration files and parameter settings
+
+Instrument and measurement classes are loaded lazily on first access, so
+importing the package (e.g. only to read config) does not pull in QCoDeS.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Migrated from LabVIEW implementation"
 
-from .instruments import *
-from .measurements import *
\ No newline at end of file
+# Public names re-exported from subpackages, mapped to their module
+_LAZY = {
+    'AMI430MagnetController': 'bluefors_dc.instruments',
+    'Keithley6221': 'bluefors_dc.instruments',
+    'Keithley2182A': 'bluefors_dc.instruments',
+    'Keithley2636B': 'bluefors_dc.instruments',
+    'ZurichMFLI': 'bluefors_dc.instruments',
+    'Lakeshore372': 'bluefors_dc.instruments',
+    'ZhinstrumentsMFLI': 'bluefors_dc.instruments',
+    'BlueFors': 'bluefors_dc.instruments',
+    'Lakeshore331': 'bluefors_dc.instruments',
+    'IVMeasurement': 'bluefors_dc.measurements',
+    'IVFieldSweep': 'bluefors_dc.measurements',
+    'IVTemperatureSweep': 'bluefors_dc.measurements',
+    'TransportMeasurement': 'bluefors_dc.measurements',
+    'HallMeasurement': 'bluefors_dc.measurements',
+    'DifferentialConductance': 'bluefors_dc.measurements',
+    'BlueforsStation': 'bluefors_dc.measurements',
+}
+
+
+def __getattr__(name: str):
+    """Import re-exported classes from their subpackage on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
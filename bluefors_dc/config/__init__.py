@@ -5,17 +5,39 @@ Configuration module for Bluefors DC measurements.
 from .default_config import (
     INSTRUMENTS,
     SAFETY_LIMITS,
+    SAFETY_LIMITS_TUPLE,
+    SafetyLimits,
     DEFAULT_MEASUREMENT_PARAMS,
+    IVDefaults,
+    DifferentialDefaults,
+    HallDefaults,
+    TemperatureSweepDefaults,
+    IV_DEFAULTS,
+    DIFFERENTIAL_DEFAULTS,
+    HALL_DEFAULTS,
+    TEMPERATURE_SWEEP_DEFAULTS,
     DATA_PATHS,
     PLOTTING_DEFAULTS,
-    LOGGING_CONFIG
+    LOGGING_CONFIG,
+    LOG_FORMATTER
 )
 
 __all__ = [
     'INSTRUMENTS',
     'SAFETY_LIMITS', 
+    'SAFETY_LIMITS_TUPLE',
+    'SafetyLimits',
     'DEFAULT_MEASUREMENT_PARAMS',
+    'IVDefaults',
+    'DifferentialDefaults',
+    'HallDefaults',
+    'TemperatureSweepDefaults',
+    'IV_DEFAULTS',
+    'DIFFERENTIAL_DEFAULTS',
+    'HALL_DEFAULTS',
+    'TEMPERATURE_SWEEP_DEFAULTS',
     'DATA_PATHS',
     'PLOTTING_DEFAULTS',
-    'LOGGING_CONFIG'
+    'LOGGING_CONFIG',
+    'LOG_FORMATTER'
 ]
\ No newline at end of file
@@ -3,8 +3,18 @@ Example configuration file for Bluefors DC measurement system.
 
 This file shows how to configure the station with all instruments
 and their typical settings.
+
+All settings are exposed as read-only mappings so they can be shared
+between measurement threads without copying.
 """
 
+import logging
+import sys
+from collections import namedtuple
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Tuple
+
 # Instrument addresses and settings
 INSTRUMENTS = {
     'magnet_controller': {
@@ -63,36 +73,59 @@ SAFETY_LIMITS = {
 }
 
 # Default measurement parameters
+# Frozen (and slotted where supported) dataclasses for attribute access;
+# DEFAULT_MEASUREMENT_PARAMS below keeps the dict view for existing code.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class IVDefaults:
+    """Default parameters for I-V measurements."""
+    current_range: Tuple[float, float] = (-1e-6, 1e-6)  # A
+    num_points: int = 100
+    delay_between_points: float = 0.1     # s
+    compliance_voltage: float = 10.0      # V
+    bidirectional: bool = True
+
+
+@dataclass(frozen=True, **_SLOTS)
+class DifferentialDefaults:
+    """Default parameters for differential conductance measurements."""
+    voltage_range: Tuple[float, float] = (-0.01, 0.01)  # V
+    num_points: int = 200
+    ac_amplitude: float = 0.001           # V
+    frequency: float = 1000.0             # Hz
+    time_constant: float = 0.03           # s
+    averages: int = 5
+
+
+@dataclass(frozen=True, **_SLOTS)
+class HallDefaults:
+    """Default parameters for Hall measurements."""
+    field_range: Tuple[float, float] = (-9.0, 9.0)     # T
+    field_points: int = 100
+    current_amplitude: float = 1e-6       # A
+    measurement_delay: float = 1.0        # s
+
+
+@dataclass(frozen=True, **_SLOTS)
+class TemperatureSweepDefaults:
+    """Default parameters for temperature sweeps."""
+    settling_time: float = 300.0          # s
+    temperature_tolerance: float = 0.01   # K
+    measurement_averages: int = 10
+
+
+IV_DEFAULTS = IVDefaults()
+DIFFERENTIAL_DEFAULTS = DifferentialDefaults()
+HALL_DEFAULTS = HallDefaults()
+TEMPERATURE_SWEEP_DEFAULTS = TemperatureSweepDefaults()
+
 DEFAULT_MEASUREMENT_PARAMS = {
-    'iv_measurement': {
-        'current_range': (-1e-6, 1e-6),  # A
-        'num_points': 100,
-        'delay_between_points': 0.1,     # s
-        'compliance_voltage': 10.0,      # V
-        'bidirectional': True,
-    },
-    
-    'differential_measurement': {
-        'voltage_range': (-0.01, 0.01),  # V
-        'num_points': 200,
-        'ac_amplitude': 0.001,           # V
-        'frequency': 1000.0,             # Hz
-        'time_constant': 0.03,           # s
-        'averages': 5,
-    },
-    
-    'hall_measurement': {
-        'field_range': (-9.0, 9.0),     # T
-        'field_points': 100,
-        'current_amplitude': 1e-6,       # A
-        'measurement_delay': 1.0,        # s
-    },
-    
-    'temperature_sweep': {
-        'settling_time': 300.0,          # s
-        'temperature_tolerance': 0.01,    # K
-        'measurement_averages': 10,
-    }
+    'iv_measurement': asdict(IV_DEFAULTS),
+    'differential_measurement': asdict(DIFFERENTIAL_DEFAULTS),
+    'hall_measurement': asdict(HALL_DEFAULTS),
+    'temperature_sweep': asdict(TEMPERATURE_SWEEP_DEFAULTS),
 }
 
 # File paths and data management
@@ -123,4 +156,28 @@ LOGGING_CONFIG = {
     'console_handler': True,
     'max_file_size': 10,  # MB
     'backup_count': 5,
-}
\ No newline at end of file
+}
+
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+INSTRUMENTS = _freeze(INSTRUMENTS)
+SAFETY_LIMITS = _freeze(SAFETY_LIMITS)
+DEFAULT_MEASUREMENT_PARAMS = _freeze(DEFAULT_MEASUREMENT_PARAMS)
+DATA_PATHS = _freeze(DATA_PATHS)
+PLOTTING_DEFAULTS = _freeze(PLOTTING_DEFAULTS)
+LOGGING_CONFIG = _freeze(LOGGING_CONFIG)
+
+# Safety limits as a named tuple for attribute access in per-point checks
+SafetyLimits = namedtuple('SafetyLimits', tuple(SAFETY_LIMITS))
+SAFETY_LIMITS_TUPLE = SafetyLimits(**SAFETY_LIMITS)
+
+# Shared formatter for log handlers, built once from LOGGING_CONFIG['format']
+LOG_FORMATTER = logging.Formatter(LOGGING_CONFIG['format'])
@@ -11,136 +11,169 @@ This module provides instrument drivers with preference for official drivers:
 - BlueFors: Fridge monitoring (contrib)
 - Lakeshore 331: Temperature controller (contrib)
 
+Drivers are resolved lazily on first attribute access, so importing this
+module only loads the driver packages that are actually used.
+
 MIGRATION NOTE: Custom drivers are deprecated in favor of official QCoDeS drivers.
 """
 
-import warnings
-import sys
-
-# Import custom drivers for fallback
-from .keithley import Keithley6221, Keithley2182A
-from .ami430 import AMI430MagnetController as CustomAMI430
-from .keithley import Keithley2636B as CustomKeithley2636B
-from .zurich import ZurichMFLI as CustomZurichMFLI
-from .lakeshore import Lakeshore372 as CustomLakeshore372
-
-# Try to import official QCoDeS drivers
-_OFFICIAL_DRIVERS_AVAILABLE = {}
-
-# AMI430 from official QCoDeS
-try:
-    from qcodes.instrument_drivers.american_magnetics.AMI430 import AMI430 as AMI430MagnetController
-    _OFFICIAL_DRIVERS_AVAILABLE['AMI430'] = True
-except ImportError:
-    AMI430MagnetController = CustomAMI430
-    _OFFICIAL_DRIVERS_AVAILABLE['AMI430'] = False
-    warnings.warn(
-        "Using custom AMI430 driver. Install latest QCoDeS for official driver.",
-        FutureWarning,
-        stacklevel=2
-    )
+import importlib
+import importlib.util
+from functools import lru_cache
+from types import MappingProxyType
+
+
+def _import(module: str, attr: str):
+    """Import ``attr`` from ``module`` (relative names resolve in this package)."""
+    return getattr(importlib.import_module(module, __name__), attr)
+
+
+# Driver table: exported name -> (official (module, attr) or None,
+#                                  custom fallback (module, attr) or None,
+#                                  package to install for the official driver)
+_SPECS = {
+    'AMI430MagnetController': (
+        ('qcodes.instrument_drivers.american_magnetics.AMI430', 'AMI430'),
+        ('.ami430', 'AMI430MagnetController'),
+        'latest QCoDeS',
+    ),
+    'Keithley2636B': (
+        ('qcodes.instrument_drivers.Keithley.Keithley_2636B', 'Keithley2636B'),
+        ('.keithley', 'Keithley2636B'),
+        'latest QCoDeS',
+    ),
+    'Lakeshore372': (
+        ('qcodes.instrument_drivers.Lakeshore.Model_372', 'Model_372'),
+        ('.lakeshore', 'Lakeshore372'),
+        'latest QCoDeS',
+    ),
+    # The official QCoDeS zurich driver has a different interface, so only
+    # zhinst-qcodes is preferred over the custom driver
+    'ZurichMFLI': (
+        ('zhinst.qcodes', 'MFLI'),
+        ('.zurich', 'ZurichMFLI'),
+        'zhinst-qcodes',
+    ),
+    'ZhinstrumentsMFLI': (('zhinst.qcodes', 'MFLI'), None, None),
+    # No official equivalent
+    'Keithley6221': (None, ('.keithley', 'Keithley6221'), None),
+    'Keithley2182A': (None, ('.keithley', 'Keithley2182A'), None),
+    # QCoDeS contrib drivers
+    'BlueFors': (('qcodes_contrib_drivers.drivers.BlueFors.BlueFors', 'BlueFors'), None, None),
+    'Lakeshore331': (('qcodes_contrib_drivers.drivers.Lakeshore.Model_331', 'Model_331'), None, None),
+}
+
+# Drivers resolved to a custom fallback; reported in one grouped warning
+_FALLBACKS = []
+_warned = False
+
+
+def _have(module: str) -> bool:
+    """Check whether ``module`` can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
 
-# Keithley 2636B from official QCoDeS
-try:
-    from qcodes.instrument_drivers.Keithley.Keithley_2636B import Keithley2636B
-    _OFFICIAL_DRIVERS_AVAILABLE['Keithley2636B'] = True
-except ImportError:
-    Keithley2636B = CustomKeithley2636B
-    _OFFICIAL_DRIVERS_AVAILABLE['Keithley2636B'] = False
-    warnings.warn(
-        "Using custom Keithley2636B driver. Install latest QCoDeS for official driver.",
-        FutureWarning,
-        stacklevel=2
-    )
 
-# Lakeshore 372 from official QCoDeS
-try:
-    from qcodes.instrument_drivers.Lakeshore.Model_372 import Model_372 as Lakeshore372
-    _OFFICIAL_DRIVERS_AVAILABLE['Lakeshore372'] = True
-except ImportError:
-    Lakeshore372 = CustomLakeshore372
-    _OFFICIAL_DRIVERS_AVAILABLE['Lakeshore372'] = False
+@lru_cache(maxsize=None)
+def _resolve(name: str):
+    """
+    Resolve a driver class by its exported name.
+
+    Official drivers are preferred; custom drivers are used as fallback.
+    The result is cached, so each driver is probed at most once per process.
+
+    Args:
+        name: Exported driver name (e.g. 'AMI430MagnetController')
+
+    Returns:
+        Tuple of (driver class or None, whether an official/contrib driver is used)
+    """
+    try:
+        official, fallback, install_hint = _SPECS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    if official is not None and _have(official[0]):
+        try:
+            return _import(*official), True
+        except ImportError:
+            pass
+
+    if fallback is None:
+        return None, False
+    if install_hint:
+        _FALLBACKS.append(name)
+    return _import(*fallback), False
+
+
+def _warn_fallbacks() -> None:
+    """Emit a single FutureWarning listing all drivers using custom fallbacks."""
+    import warnings
+
+    global _warned
+    _warned = True
+    # Include fallbacks that have not been resolved yet, without importing them
+    for name, (official, _, install_hint) in _SPECS.items():
+        if install_hint and name not in _FALLBACKS and not _have(official[0]):
+            _FALLBACKS.append(name)
+    hints = ' and '.join(sorted({_SPECS[name][2] for name in _FALLBACKS}))
     warnings.warn(
-        "Using custom Lakeshore372 driver. Install latest QCoDeS for official driver.",
+        f"Using custom drivers: {', '.join(_FALLBACKS)}. "
+        f"Install {hints} for official drivers.",
         FutureWarning,
-        stacklevel=2
+        stacklevel=3
     )
 
-# Zurich MFLI - prefer zhinst-qcodes, then official QCoDeS, then custom
-ZhinstrumentsMFLI = None
-ZurichMFLI = None
-
-try:
-    from zhinst.qcodes import MFLI as ZhinstrumentsMFLI
-    ZurichMFLI = ZhinstrumentsMFLI
-    _OFFICIAL_DRIVERS_AVAILABLE['ZhinstrumentsMFLI'] = True
-    _OFFICIAL_DRIVERS_AVAILABLE['ZurichMFLI'] = True
-except ImportError:
-    _OFFICIAL_DRIVERS_AVAILABLE['ZhinstrumentsMFLI'] = False
-    # Try to fall back to official QCoDeS zurich instruments driver
-    # Note: The official driver requires zhinst-toolkit, so it may not be available
-    try:
-        from qcodes.instrument_drivers.zurich_instruments import ZIUHFLI
-        # For now, keep using custom driver as the official one has different interface
-        ZurichMFLI = CustomZurichMFLI
-        _OFFICIAL_DRIVERS_AVAILABLE['ZurichMFLI'] = False
-        warnings.warn(
-            "Using custom Zurich MFLI driver. Install zhinst-qcodes for full functionality.",
-            FutureWarning,
-            stacklevel=2
-        )
-    except ImportError:
-        ZurichMFLI = CustomZurichMFLI
-        _OFFICIAL_DRIVERS_AVAILABLE['ZurichMFLI'] = False
-        warnings.warn(
-            "Using custom Zurich MFLI driver. Install zhinst-qcodes for official drivers.",
-            FutureWarning,
-            stacklevel=2
-        )
-
-# QCoDeS contrib drivers
-try:
-    from qcodes_contrib_drivers.drivers.BlueFors.BlueFors import BlueFors
-    _BLUEFORS_AVAILABLE = True
-except ImportError:
-    _BLUEFORS_AVAILABLE = False
-    BlueFors = None
-
-try:
-    from qcodes_contrib_drivers.drivers.Lakeshore.Model_331 import Model_331 as Lakeshore331
-    _LAKESHORE331_AVAILABLE = True
-except ImportError:
-    _LAKESHORE331_AVAILABLE = False
-    Lakeshore331 = None
-
-# Base exports (always available)
-__all__ = [
+
+def __getattr__(name: str):
+    """
+    Resolve drivers on first access and bind them as module globals.
+
+    Optional drivers without a fallback resolve to None when their package
+    is not installed, so ``from bluefors_dc.instruments import BlueFors``
+    keeps working and callers can test the name for availability.
+    """
+    cls, _ = _resolve(name)
+    if cls is not None and not _warned and name in _FALLBACKS:
+        _warn_fallbacks()
+    globals()[name] = cls
+    return cls
+
+
+# Base exports (always available) plus optional official/contrib drivers
+__all__ = (
     'AMI430MagnetController',
     'Keithley6221',
-    'Keithley2182A', 
+    'Keithley2182A',
     'Keithley2636B',
     'ZurichMFLI',
     'Lakeshore372',
-]
-
-# Add official Zurich Instruments drivers to exports if available
-if _OFFICIAL_DRIVERS_AVAILABLE.get('ZhinstrumentsMFLI'):
-    __all__.append('ZhinstrumentsMFLI')
-
-# Add contrib drivers to exports if available
-if _BLUEFORS_AVAILABLE:
-    __all__.append('BlueFors')
-    
-if _LAKESHORE331_AVAILABLE:
-    __all__.append('Lakeshore331')
+) + tuple(
+    name for name in ('ZhinstrumentsMFLI', 'BlueFors', 'Lakeshore331')
+    if _have(_SPECS[name][0][0])
+)
 
 # Migration status information
+@lru_cache(maxsize=1)
 def get_driver_status():
-    """Get status of official vs custom drivers."""
-    return {
-        'official_drivers_available': _OFFICIAL_DRIVERS_AVAILABLE,
-        'contrib_drivers_available': {
-            'BlueFors': _BLUEFORS_AVAILABLE,
-            'Lakeshore331': _LAKESHORE331_AVAILABLE,
-        }
-    }
\ No newline at end of file
+    """
+    Get status of official vs custom drivers.
+
+    The status does not change after the drivers are resolved, so the
+    result is computed once and returned as a read-only mapping.
+    """
+    return MappingProxyType({
+        'official_drivers_available': MappingProxyType({
+            'AMI430': _resolve('AMI430MagnetController')[1],
+            'Keithley2636B': _resolve('Keithley2636B')[1],
+            'Lakeshore372': _resolve('Lakeshore372')[1],
+            'ZhinstrumentsMFLI': _resolve('ZhinstrumentsMFLI')[1],
+            'ZurichMFLI': _resolve('ZurichMFLI')[1],
+        }),
+        'contrib_drivers_available': MappingProxyType({
+            'BlueFors': _resolve('BlueFors')[1],
+            'Lakeshore331': _resolve('Lakeshore331')[1],
+        })
+    })
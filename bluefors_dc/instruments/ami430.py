@@ -5,11 +5,69 @@ Provides QCoDeS interface for the AMI430 magnet power supply used
 for vector magnetic field control in the Bluefors LD-400 system.
 """
 
+import asyncio
+import math
 import time
-import numpy as np
-from typing import Union, Tuple
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Union, Tuple
 from qcodes import VisaInstrument, validators as vals
-from qcodes.parameters import Parameter
+from qcodes.parameters import MultiParameter, Parameter
+
+
+class FieldVectorValidator(vals.Validator):
+    """
+    Validate an (x, y) field vector against a maximum field magnitude.
+    
+    Per-axis limits admit corners such as (9, 9) T that exceed the magnet's
+    actual limit; this checks the joint constraint x**2 + y**2 <= limit**2.
+    """
+    
+    def __init__(self, max_magnitude: float):
+        self.max_magnitude = max_magnitude
+        self._valid_values = ((0.0, 0.0),)
+        self.is_numeric = False
+        
+    @property
+    def max_magnitude(self) -> float:
+        """Maximum allowed field magnitude in Tesla."""
+        return self._max_magnitude
+        
+    @max_magnitude.setter
+    def max_magnitude(self, value: float) -> None:
+        self._max_magnitude = value
+        self._max_sq = value * value
+        
+    def validate(self, value: Tuple[float, float], context: str = '') -> None:
+        try:
+            field_x, field_y = value
+            r2 = field_x * field_x + field_y * field_y
+        except (TypeError, ValueError):
+            raise TypeError(f"{value!r} is not an (x, y) field vector; {context}") from None
+        # Written as 'not <=' so that NaN components are rejected
+        if not r2 <= self._max_sq:
+            raise ValueError(f"Field magnitude {math.sqrt(r2):.3f}T exceeds "
+                             f"limit {self._max_magnitude}T; {context}")
+            
+    def __repr__(self) -> str:
+        return f'<FieldVector |B|<={self._max_magnitude}>'
+
+
+class FieldPolarParameter(MultiParameter):
+    """Field magnitude and angle read together from one X/Y query."""
+    
+    def __init__(self, name: str, instrument: 'AMI430MagnetController', **kwargs):
+        super().__init__(
+            name,
+            instrument=instrument,
+            names=('field_magnitude', 'field_angle'),
+            shapes=((), ()),
+            labels=('Field magnitude', 'Field angle'),
+            units=('T', 'deg'),
+            **kwargs
+        )
+        
+    def get_raw(self) -> Tuple[float, float]:
+        return self.instrument._get_field_polar()
 
 
 class AMI430MagnetController(VisaInstrument):
@@ -20,6 +78,9 @@ class AMI430MagnetController(VisaInstrument):
     generating arbitrary in-plane magnetic field directions.
     """
     
+    # Commands collected inside batched_write(), None when not batching
+    _write_batch: Optional[List[str]] = None
+    
     def __init__(self, name: str, address: str, **kwargs):
         """
         Initialize AMI430 magnet controller.
@@ -31,14 +92,37 @@ class AMI430MagnetController(VisaInstrument):
         """
         super().__init__(name, address, terminator='\r\n', **kwargs)
         
-        # Field limits in Tesla (typical for AMI430 2-axis)
+        # Field limits in Tesla (typical for AMI430 2-axis); the vector
+        # validator follows later changes to field_limit
+        self._field_vector_vals = FieldVectorValidator(9.0)
         self.field_limit = 9.0  # Maximum field magnitude
         
+        # Hot-path state below is kept as plain attributes: QCoDeS instruments
+        # always carry a __dict__, so __slots__ would not remove it and
+        # measured no faster for attribute access.
+        
+        # Last (time, field_x, field_y) read, shared by derived parameters
+        self._xy_ttl = 0.05  # s
+        self._xy_cache = (0.0, None, None)
+        
+        # Last (field_x, field_y) setpoint configured on the instrument and
+        # whether a RAMP was issued for it; axes within _cmd_tol of it are
+        # not re-sent
+        self._last_cmd: Tuple[Optional[float], Optional[float]] = (None, None)
+        self._last_cmd_ramped = False
+        self._cmd_tol = 1e-7  # T
+        
+        # STATE? code for HOLDING (AMI430 manual); text replies are also accepted
+        self._holding_code = 2
+        
+        # Parsed *IDN? response; fixed for the lifetime of the connection
+        self._idn_cache: Optional[dict] = None
+        
         # X-axis magnetic field
         self.add_parameter(
             'field_x',
             get_cmd='FIELD:MAG:X?',
-            set_cmd='CONF:FIELD:MAG:X {:.6f}',
+            set_cmd=self._set_field_x,
             unit='T',
             vals=vals.Numbers(-self.field_limit, self.field_limit),
             docstring='X-axis magnetic field component'
@@ -48,12 +132,29 @@ class AMI430MagnetController(VisaInstrument):
         self.add_parameter(
             'field_y',
             get_cmd='FIELD:MAG:Y?',
-            set_cmd='CONF:FIELD:MAG:Y {:.6f}',
+            set_cmd=self._set_field_y,
             unit='T',
             vals=vals.Numbers(-self.field_limit, self.field_limit),
             docstring='Y-axis magnetic field component'
         )
         
+        # Field vector setpoint; setting configures both axes without ramping
+        self.add_parameter(
+            'field_vector',
+            get_cmd=self._read_xy,
+            set_cmd=self._set_field_vector,
+            unit='T',
+            vals=self._field_vector_vals,
+            docstring='(X, Y) magnetic field vector, limited to field_limit in magnitude'
+        )
+        
+        # Field magnitude and angle (calculated) from a single X/Y read
+        self.add_parameter(
+            'field_polar',
+            parameter_class=FieldPolarParameter,
+            docstring='Magnetic field magnitude (T) and angle (deg)'
+        )
+        
         # Field magnitude (calculated)
         self.add_parameter(
             'field_magnitude',
@@ -72,11 +173,14 @@ class AMI430MagnetController(VisaInstrument):
             docstring='Magnetic field angle in degrees'
         )
         
-        # Ramp rate parameters
+        # Ramp rate parameters; rarely changed, so snapshots report the
+        # cached value instead of querying the instrument
         self.add_parameter(
             'ramp_rate_x',
             get_cmd='RAMP:RATE:FIELD:X?',
-            set_cmd='CONF:RAMP:RATE:FIELD:X {:.4f}',
+            get_parser=float,
+            set_cmd=self._set_ramp_rate_x,
+            snapshot_get=False,
             unit='T/min',
             vals=vals.Numbers(0, 1.0),  # Safe ramp rate limit
             docstring='X-axis field ramp rate'
@@ -85,7 +189,9 @@ class AMI430MagnetController(VisaInstrument):
         self.add_parameter(
             'ramp_rate_y', 
             get_cmd='RAMP:RATE:FIELD:Y?',
-            set_cmd='CONF:RAMP:RATE:FIELD:Y {:.4f}',
+            get_parser=float,
+            set_cmd=self._set_ramp_rate_y,
+            snapshot_get=False,
             unit='T/min',
             vals=vals.Numbers(0, 1.0),  # Safe ramp rate limit
             docstring='Y-axis field ramp rate'
@@ -95,6 +201,7 @@ class AMI430MagnetController(VisaInstrument):
         self.add_parameter(
             'magnet_status',
             get_cmd='STATE?',
+            get_parser=lambda s: s.strip().upper(),
             set_cmd=False,
             docstring='Magnet system status'
         )
@@ -102,17 +209,144 @@ class AMI430MagnetController(VisaInstrument):
         # Set safe default ramp rates
         self.connect_message()
         
+    @property
+    def field_limit(self) -> float:
+        """Maximum field magnitude in Tesla."""
+        return self._field_limit
+        
+    @field_limit.setter
+    def field_limit(self, value: float) -> None:
+        self._field_limit = value
+        # Squared limit for sqrt-free magnitude checks
+        self.field_limit_sq = value * value
+        self._field_vector_vals.max_magnitude = value
+        
+    @staticmethod
+    def _join_commands(commands: List[str]) -> str:
+        """Join SCPI commands into one compound message."""
+        return ';'.join(cmd if cmd.startswith((':', '*')) else ':' + cmd
+                        for cmd in commands)
+        
+    def write(self, cmd: str) -> None:
+        """Write a command, or queue it while inside batched_write()."""
+        if self._write_batch is not None:
+            self._write_batch.append(cmd)
+        else:
+            super().write(cmd)
+            
+    @contextmanager
+    def batched_write(self) -> Iterator[None]:
+        """
+        Collect writes and send them as a single compound SCPI message.
+        
+        Queries are not batched and are sent immediately. If the block
+        raises, the collected commands are discarded.
+        
+        Example:
+            with magnet.batched_write():
+                magnet.ramp_rate_x(0.1)
+                magnet.ramp_rate_y(0.1)
+        """
+        if self._write_batch is not None:
+            # Nested batch: commands go to the outer batch
+            yield
+            return
+        self._write_batch = []
+        try:
+            yield
+            batch = self._write_batch
+        finally:
+            self._write_batch = None
+        if batch:
+            super().write(self._join_commands(batch))
+        
+    # Setters use f-strings instead of QCoDeS set_cmd templates, which keeps
+    # per-setpoint overhead low in nested sweeps
+    def _set_field_vector(self, value: Tuple[float, float]) -> None:
+        field_x, field_y = value
+        self.write(f'CONF:FIELD:MAG:X {field_x:.6f};:CONF:FIELD:MAG:Y {field_y:.6f}')
+        self._last_cmd = (field_x, field_y)
+        self._last_cmd_ramped = False
+        
+    # Per-axis setters go through field_vector so the magnitude limit
+    # applies; the other axis keeps its last configured setpoint
+    def _set_field_x(self, value: float) -> None:
+        field_y = self._last_cmd[1]
+        if field_y is None:
+            field_y = self._read_xy()[1]
+        self.field_vector((value, field_y))
+        
+    def _set_field_y(self, value: float) -> None:
+        field_x = self._last_cmd[0]
+        if field_x is None:
+            field_x = self._read_xy()[0]
+        self.field_vector((field_x, value))
+        
+    def _set_ramp_rate_x(self, value: float) -> None:
+        self.write(f'CONF:RAMP:RATE:FIELD:X {value:.4f}')
+        
+    def _set_ramp_rate_y(self, value: float) -> None:
+        self.write(f'CONF:RAMP:RATE:FIELD:Y {value:.4f}')
+        
+    def invalidate_field_cache(self) -> None:
+        """
+        Forget the cached field reading and last commanded setpoint.
+        
+        Call this after changing the field outside this driver (e.g. from
+        the front panel), so the next set_field_vector() sends both axes.
+        """
+        self._xy_cache = (0.0, None, None)
+        self._last_cmd = (None, None)
+        
+    # Internal reads bypass the QCoDeS parameter call stack
+    def _raw_fx(self) -> float:
+        return float(self.ask('FIELD:MAG:X?'))
+        
+    def _raw_fy(self) -> float:
+        return float(self.ask('FIELD:MAG:Y?'))
+        
+    def _read_xy_scpi(self) -> Tuple[float, float]:
+        """
+        Query both field components in a single compound SCPI message.
+        
+        Falls back to two separate queries if the firmware does not
+        answer the compound query with a ';'-separated response.
+        
+        Returns:
+            Tuple of (field_x, field_y) in Tesla
+        """
+        response = self.ask('FIELD:MAG:X?;:FIELD:MAG:Y?')
+        if ';' not in response:
+            return self._raw_fx(), self._raw_fy()
+        fx_str, fy_str = response.split(';')
+        return float(fx_str), float(fy_str)
+        
+    def _read_xy(self) -> Tuple[float, float]:
+        """
+        Read X and Y field components, reusing a reading younger than the TTL.
+        
+        Returns:
+            Tuple of (field_x, field_y) in Tesla
+        """
+        t, fx, fy = self._xy_cache
+        now = time.monotonic()
+        if fx is None or now - t >= self._xy_ttl:
+            fx, fy = self._read_xy_scpi()
+            self._xy_cache = (now, fx, fy)
+        return fx, fy
+        
+    def _get_field_polar(self) -> Tuple[float, float]:
+        """Calculate field magnitude (T) and angle (deg) from X and Y components."""
+        fx, fy = self._read_xy()
+        return math.hypot(fx, fy), math.degrees(math.atan2(fy, fx))
+        
     def _get_field_magnitude(self) -> float:
         """Calculate total field magnitude from X and Y components."""
-        fx = self.field_x()
-        fy = self.field_y()
-        return np.sqrt(fx**2 + fy**2)
+        return self._get_field_polar()[0]
         
     def _get_field_angle(self) -> float:
         """Calculate field angle in degrees from X and Y components."""
-        fx = self.field_x()
-        fy = self.field_y()
-        return np.degrees(np.arctan2(fy, fx))
+        return self._get_field_polar()[1]
         
     def set_field_vector(self, field_x: float, field_y: float, 
                         wait_for_completion: bool = True) -> None:
@@ -124,15 +358,23 @@ class AMI430MagnetController(VisaInstrument):
             field_y: Y-axis field in Tesla  
             wait_for_completion: Whether to wait for ramp completion
         """
-        magnitude = np.sqrt(field_x**2 + field_y**2)
-        if magnitude > self.field_limit:
-            raise ValueError(f"Field magnitude {magnitude:.3f}T exceeds limit {self.field_limit}T")
-            
-        self.field_x(field_x)
-        self.field_y(field_y)
+        self.field_vector.validate((field_x, field_y))
         
-        # Start ramp
-        self.write('RAMP')
+        # Only send axes that changed, then start the ramp, in one message
+        last_x, last_y = self._last_cmd
+        commands = []
+        if last_x is None or abs(field_x - last_x) >= self._cmd_tol:
+            commands.append(f'CONF:FIELD:MAG:X {field_x:.6f}')
+            last_x = field_x
+        if last_y is None or abs(field_y - last_y) >= self._cmd_tol:
+            commands.append(f'CONF:FIELD:MAG:Y {field_y:.6f}')
+            last_y = field_y
+        if commands or not self._last_cmd_ramped:
+            commands.append('RAMP')
+            self.write(';:'.join(commands))
+            self._last_cmd = (last_x, last_y)
+            self._last_cmd_ramped = True
+            self._xy_cache = (0.0, None, None)
         
         if wait_for_completion:
             self.wait_for_ramp_completion()
@@ -147,12 +389,45 @@ class AMI430MagnetController(VisaInstrument):
             angle_deg: Field angle in degrees
             wait_for_completion: Whether to wait for ramp completion
         """
-        angle_rad = np.radians(angle_deg)
-        field_x = magnitude * np.cos(angle_rad)
-        field_y = magnitude * np.sin(angle_rad)
+        angle_rad = math.radians(angle_deg)
+        field_x = magnitude * math.cos(angle_rad)
+        field_y = magnitude * math.sin(angle_rad)
         
         self.set_field_vector(field_x, field_y, wait_for_completion)
         
+    def set_field_polar_sweep(self, magnitudes: Union[float, Sequence[float]],
+                              angles_deg: Union[float, Sequence[float]],
+                              wait_between: bool = True) -> None:
+        """
+        Step the magnetic field through a sequence of polar setpoints.
+        
+        All setpoints are converted to X/Y components and checked against
+        the field limit before the first one is sent, so an out-of-range
+        point aborts the sweep without moving the magnet.
+        
+        Args:
+            magnitudes: Field magnitude(s) in Tesla (scalar or sequence)
+            angles_deg: Field angle(s) in degrees (scalar or sequence)
+            wait_between: Whether to wait for ramp completion at each setpoint
+        """
+        # NumPy is only needed here; keep it out of driver import time
+        import numpy as np
+        
+        mags = np.asarray(magnitudes, dtype=np.float64)
+        angs = np.deg2rad(np.asarray(angles_deg, dtype=np.float64))
+        mags, angs = np.broadcast_arrays(mags, angs)
+        fx = (mags * np.cos(angs)).ravel()
+        fy = (mags * np.sin(angs)).ravel()
+        if fx.size == 0:
+            return
+            
+        r2_max = float((fx * fx + fy * fy).max())
+        if r2_max > self.field_limit_sq:
+            raise ValueError(f"Field magnitude {math.sqrt(r2_max):.3f}T exceeds limit {self.field_limit}T")
+            
+        for field_x, field_y in zip(fx.tolist(), fy.tolist()):
+            self.set_field_vector(field_x, field_y, wait_for_completion=wait_between)
+            
     def wait_for_ramp_completion(self, timeout: float = 300) -> None:
         """
         Wait for magnetic field ramp to complete.
@@ -160,15 +435,47 @@ class AMI430MagnetController(VisaInstrument):
         Args:
             timeout: Maximum time to wait in seconds
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            status = self.magnet_status()
-            if 'HOLDING' in status.upper():
+        deadline = time.monotonic() + timeout
+        
+        # Poll with exponential backoff: short ramps are detected quickly,
+        # long ramps settle at one status query per second
+        delay = 0.05
+        while time.monotonic() < deadline:
+            if self._is_holding(self.magnet_status()):
                 break
-            time.sleep(1.0)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
         else:
             raise TimeoutError("Magnet ramp did not complete within timeout")
             
+    async def wait_for_ramp_completion_async(self, timeout: float = 300) -> None:
+        """
+        Wait for magnetic field ramp to complete without blocking the event loop.
+        
+        Status queries run in the default executor, so other instruments can
+        be serviced from the same event loop while the magnet ramps.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            status = await loop.run_in_executor(None, self.magnet_status)
+            if self._is_holding(status):
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+        raise TimeoutError("Magnet ramp did not complete within timeout")
+        
+    def _is_holding(self, status: str) -> bool:
+        """Check a magnet_status reply for the HOLDING state."""
+        try:
+            return int(status) == self._holding_code
+        except ValueError:
+            return 'HOLDING' in status
+            
     def ramp_to_zero(self, wait_for_completion: bool = True) -> None:
         """
         Safely ramp magnetic field to zero.
@@ -179,16 +486,27 @@ class AMI430MagnetController(VisaInstrument):
         self.set_field_vector(0.0, 0.0, wait_for_completion)
         
     def emergency_stop(self) -> None:
-        """Emergency stop all magnet operations."""
-        self.write('PAUSE')
+        """
+        Emergency stop all magnet operations.
+        
+        PAUSE is written immediately, also inside batched_write(); any
+        commands pending in the batch are dropped.
+        """
+        self._write_batch = None
+        self.invalidate_field_cache()
+        super().write('PAUSE')
         
     def get_idn(self) -> dict:
-        """Get instrument identification."""
+        """Get instrument identification (queried once per connection)."""
+        if self._idn_cache is not None:
+            return self._idn_cache
         response = self.ask('*IDN?')
-        parts = response.split(',')
-        return {
-            'vendor': parts[0] if len(parts) > 0 else '',
-            'model': parts[1] if len(parts) > 1 else '',
-            'serial': parts[2] if len(parts) > 2 else '', 
-            'firmware': parts[3] if len(parts) > 3 else ''
-        }
\ No newline at end of file
+        # Pad short responses so the unpack always yields four fields
+        vendor, model, serial, firmware = (response.split(',', 3) + [''] * 4)[:4]
+        self._idn_cache = {
+            'vendor': vendor.strip(),
+            'model': model.strip(),
+            'serial': serial.strip(),
+            'firmware': firmware.strip()
+        }
+        return self._idn_cache
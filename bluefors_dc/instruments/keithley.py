@@ -9,15 +9,302 @@ QCoDeS drivers for Keithley measurement instruments:
 Enhanced drivers following PyMeasure reference implementations and QCoDeS guidelines.
 """
 
-import time
-import warnings
-import numpy as np
-from typing import Union, List, Optional, Tuple
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import (TYPE_CHECKING, Callable, Dict, Iterator, Union, List, NamedTuple,
+                    Optional, Sequence, Tuple)
+from pyvisa.errors import VisaIOError
 from qcodes import VisaInstrument, validators as vals
 from qcodes.parameters import Parameter
 
+# NumPy and warnings are imported in the methods that use them, which keeps
+# them out of the driver import path
+if TYPE_CHECKING:
+    import numpy as np
 
-class Keithley6221(VisaInstrument):
+
+# Parameter value mappings and validators shared by all driver instances
+# (built once at import instead of in every __init__)
+_ONOFF_01 = {'ON': 1, 'OFF': 0}
+_SHIELD_MAP = {True: 'GUAR', False: 'OLOW'}
+_DELTA_UNIT_MAP = {'V': 'V', 'Ohms': 'OHMS', 'W': 'W', 'Siemens': 'SIEM'}
+_WAVE_FUNC = {
+    'sine': 'SIN', 'ramp': 'RAMP', 'square': 'SQU',
+    'arbitrary1': 'ARB1', 'arbitrary2': 'ARB2',
+    'arbitrary3': 'ARB3', 'arbitrary4': 'ARB4'
+}
+_WAVE_RANGING_MAP = {'best': 'BEST', 'fixed': 'FIX'}
+_CHANNEL_FUNC_MAP = {'voltage': '"VOLT:DC"', 'temperature': '"TEMP"'}
+_CURR_RANGE = vals.Numbers(-0.105, 0.105)  # 6221 source current limits in A
+
+# Read chunk for buffer transfers. With pyvisa's default of 20 kB a large
+# binary block is assembled from many reads; small queries keep the
+# default so they do not allocate a large read buffer each time.
+_BULK_CHUNK_SIZE = 1 << 20
+
+# Allowances for the 2636B sweep timeout in s: the longest automatic
+# measure delay, and source/trigger overhead per point
+_AUTO_MEASURE_DELAY = 0.1
+_SWEEP_POINT_OVERHEAD = 0.01
+
+
+class IVPoint(NamedTuple):
+    """Current and voltage measured together (tuple layout, no per-instance dict)."""
+    current: float
+    voltage: float
+
+
+class DeduplicatingParameter(Parameter):
+    """
+    Parameter that skips the write when set to the value it was last set to.
+    
+    Only values passed to set() are remembered. Readings from get() are
+    not, because for source levels get() returns a measurement rather
+    than the setpoint. Call forget_setpoint() when the instrument state
+    changes outside the parameter (e.g. *RST).
+    """
+    
+    _NO_SETPOINT = object()
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._setpoint = self._NO_SETPOINT
+        set_value = self.set
+        
+        def set(value, **kwargs) -> None:
+            if value == self._setpoint:
+                return
+            set_value(value, **kwargs)
+            self._setpoint = value
+            
+        self.set = set
+        
+    def forget_setpoint(self) -> None:
+        """Write the next value even if it equals the last one."""
+        self._setpoint = self._NO_SETPOINT
+
+
+def _forget_setpoints(instrument: VisaInstrument) -> None:
+    """Forget the setpoints of all deduplicating parameters of an instrument."""
+    for parameter in instrument.parameters.values():
+        if isinstance(parameter, DeduplicatingParameter):
+            parameter.forget_setpoint()
+
+
+# Parsers for boolean parameters; cheaper than a val_mapping lookup on
+# every get/set
+def _bool_to_01(value: bool) -> str:
+    return '1' if value else '0'
+
+
+def _bool_to_onoff(value: bool) -> str:
+    return 'ON' if value else 'OFF'
+
+
+def _parse_01(response: str) -> bool:
+    return bool(int(response))
+
+
+def _parse_onoff(response: str) -> bool:
+    # Boolean queries may answer ON/OFF or 1/0
+    return response.strip().upper() in ('1', 'ON')
+
+def _tune_visa_transport(instrument: VisaInstrument) -> None:
+    """
+    Apply interface specific VISA settings for throughput.
+    
+    Raw TCP sockets get TCP_NODELAY, so short queries are not held back by
+    Nagle's algorithm, and a large read chunk for buffer transfers.
+    Other interfaces keep the VISA defaults.
+    """
+    handle = instrument.visa_handle
+    if not str(handle.resource_name).upper().endswith('::SOCKET'):
+        return
+    try:
+        handle.tcp_nodelay = True
+    except (VisaIOError, NotImplementedError):
+        # Attribute not supported by this VISA backend
+        pass
+    handle.chunk_size = _BULK_CHUNK_SIZE
+
+
+class _LockedIOMixin:
+    """
+    Serialize VISA I/O per instrument with a reentrant lock.
+    
+    PyVISA resources are not thread-safe, but different instruments can be
+    used from different threads (see bluefors_dc.utils.read_parallel). The
+    lock keeps a query's write and read together when one instrument is
+    shared between threads.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        # Created first: the VisaInstrument constructor already does I/O
+        self._io_lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+        
+    def write_raw(self, cmd: str) -> None:
+        with self._io_lock:
+            super().write_raw(cmd)
+            
+    def ask_raw(self, cmd: str) -> str:
+        with self._io_lock:
+            return super().ask_raw(cmd)
+
+
+class _CachedIdnMixin:
+    """
+    Query ``*IDN?`` once per connection.
+    
+    The identification does not change while connected, but QCoDeS reads
+    it for every connect message and snapshot of the IDN parameter.
+    """
+    
+    # Parsed identification, None until successfully queried
+    _idn_cache: Optional[Dict[str, Optional[str]]] = None
+    
+    def get_idn(self) -> Dict[str, Optional[str]]:
+        if self._idn_cache is None:
+            idn = super().get_idn()
+            # QCoDeS returns all None if the query failed; retry next time
+            if any(value is not None for value in idn.values()):
+                self._idn_cache = idn
+            return idn
+        return self._idn_cache
+
+
+class _BatchedWriteMixin:
+    """
+    Coalesce writes into a single compound SCPI message.
+    
+    Inside ``batched_write()`` writes are queued and sent as one message
+    when the block exits. A query flushes the queued writes first, so
+    commands still reach the instrument in order.
+    """
+    
+    # Commands collected inside batched_write(), None when not batching
+    _write_batch: Optional[List[str]] = None
+    
+    @staticmethod
+    def _join_commands(commands: List[str]) -> str:
+        """Join SCPI commands into one compound message."""
+        return ';'.join(cmd if cmd.startswith((':', '*')) else ':' + cmd
+                        for cmd in commands)
+        
+    def write(self, cmd: str) -> None:
+        """Write a command, or queue it while inside batched_write()."""
+        if self._write_batch is not None:
+            self._write_batch.append(cmd.rstrip(';'))
+        else:
+            super().write(cmd)
+            
+    def ask(self, cmd: str) -> str:
+        """Send queued writes, then query."""
+        self._flush_write_batch()
+        return super().ask(cmd)
+        
+    def _flush_write_batch(self) -> None:
+        """Send commands queued so far and keep batching."""
+        if self._write_batch:
+            batch, self._write_batch = self._write_batch, []
+            super().write(self._join_commands(batch))
+            
+    @contextmanager
+    def batched_write(self) -> Iterator[None]:
+        """
+        Collect writes and send them as a single compound SCPI message.
+        
+        If the block raises, commands not yet sent are discarded.
+        
+        Example:
+            with source.batched_write():
+                source.source_current(1e-3)
+                source.source_compliance(1.0)
+                source.source_range(1e-3)
+        """
+        if self._write_batch is not None:
+            # Nested batch: commands go to the outer batch
+            yield
+            return
+        self._write_batch = []
+        try:
+            yield
+            batch = self._write_batch
+        except BaseException:
+            # Discarded commands may include deduplicated setpoints
+            _forget_setpoints(self)
+            raise
+        finally:
+            self._write_batch = None
+        if batch:
+            super().write(self._join_commands(batch))
+
+
+class _AsyncQueryMixin:
+    """
+    Awaitable queries for VISA instruments.
+    
+    Queries run in the event loop's default executor, so queries to
+    different instruments overlap instead of running back to back.
+    """
+    
+    async def _ask_async(self, cmd: str) -> str:
+        """Send a query without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.ask, cmd)
+
+
+class _CompoundStateMixin:
+    """
+    Refresh many parameters with a single compound SCPI query.
+    
+    Subclasses map parameter names to their query in ``_STATE_QUERIES``.
+    ``snapshot(update=True)`` then costs one round-trip for all of them
+    instead of one per parameter; regular parameter reads are unchanged.
+    """
+    
+    _STATE_QUERIES: Dict[str, str] = {}
+    
+    def refresh_state(self) -> Dict[str, str]:
+        """
+        Query all state parameters at once and update their cached values.
+        
+        Returns:
+            Raw instrument responses by parameter name
+        """
+        # Aliases share a query, so each distinct query is sent only once
+        queries = list(dict.fromkeys(self._STATE_QUERIES.values()))
+        compound = ';'.join(q if q.startswith((':', '*')) else ':' + q for q in queries)
+        replies = self.ask(compound).split(';')
+        if len(replies) != len(queries):
+            raise ValueError(f"Expected {len(queries)} replies to state query, "
+                             f"got {len(replies)}")
+        raw_by_query = dict(zip(queries, (r.strip() for r in replies)))
+        
+        state = {}
+        for name, query in self._STATE_QUERIES.items():
+            state[name] = raw_by_query[query]
+            self.parameters[name].cache._set_from_raw_value(state[name])
+        return state
+        
+    def snapshot_base(self, update: Optional[bool] = False,
+                      params_to_skip_update: Optional[Sequence[str]] = None) -> dict:
+        if update:
+            try:
+                self.refresh_state()
+            except Exception as e:
+                # Fall back to per-parameter queries
+                self.log.warning(f"Compound state query failed: {e}")
+            else:
+                params_to_skip_update = (list(params_to_skip_update or ())
+                                         + list(self._STATE_QUERIES))
+        return super().snapshot_base(update=update,
+                                     params_to_skip_update=params_to_skip_update)
+
+
+class Keithley6221(_CompoundStateMixin, _AsyncQueryMixin, _BatchedWriteMixin,
+                   _CachedIdnMixin, _LockedIOMixin, VisaInstrument):
     """
     QCoDeS driver for Keithley 6221 AC/DC Current Source.
     
@@ -25,22 +312,64 @@ class Keithley6221(VisaInstrument):
     and I-V measurements, with support for delta mode operations, waveform generation,
     and advanced triggering.
 
+    Over Ethernet, the raw socket address 'TCPIP::<host>::1394::SOCKET' has
+    less per-query overhead than VXI-11 ('TCPIP::<host>::INSTR').
+
     Args:
         name: Name of the instrument
         address: VISA resource address
         **kwargs: Additional arguments passed to VisaInstrument
     """
     
+    # Parameters refreshed together by refresh_state()
+    _STATE_QUERIES = {
+        'source_enabled': ':OUTP?',
+        'output': ':OUTP?',
+        'shield_to_guard_enabled': ':OUTP:ISH?',
+        'source_delay': ':SOUR:DEL?',
+        'output_low_grounded': ':OUTP:LTE?',
+        'source_current': ':SOUR:CURR?',
+        'current': ':SOUR:CURR?',
+        'source_compliance': ':SOUR:CURR:COMP?',
+        'compliance_voltage': ':SOUR:CURR:COMP?',
+        'source_range': ':SOUR:CURR:RANG?',
+        'current_range': ':SOUR:CURR:RANG?',
+        'source_auto_range': ':SOUR:CURR:RANG:AUTO?',
+        'delta_unit': ':UNIT:VOLT:DC?',
+        'delta_high_source': ':SOUR:DELT:HIGH?',
+        'delta_low_source': ':SOUR:DELT:LOW?',
+        'delta_delay': ':SOUR:DELT:DEL?',
+        'delta_cycles': ':SOUR:DELT:COUN?',
+        'delta_measurement_sets': ':SOUR:SWE:COUN?',
+        'delta_compliance_abort_enabled': ':SOUR:DELT:CAB?',
+        'waveform_function': ':SOUR:WAVE:FUNC?',
+        'waveform_frequency': ':SOUR:WAVE:FREQ?',
+        'waveform_amplitude': ':SOUR:WAVE:AMPL?',
+        'waveform_offset': ':SOUR:WAVE:OFFS?',
+        'waveform_dutycycle': ':SOUR:WAVE:DCYC?',
+        'waveform_duration_time': ':SOUR:WAVE:DUR:TIME?',
+        'waveform_duration_cycles': ':SOUR:WAVE:DUR:CYCL?',
+        'waveform_ranging': ':SOUR:WAVE:RANG?',
+        'measurement_event_enabled': ':STAT:MEAS:ENAB?',
+        'operation_event_enabled': ':STAT:OPER:ENAB?',
+        'questionable_event_enabled': ':STAT:QUES:ENAB?',
+        'srq_event_enabled': '*SRE?',
+        'display_enabled': ':DISP:ENAB?',
+    }
+    
     def __init__(self, name: str, address: str, **kwargs):
         """Initialize Keithley 6221 current source."""
         super().__init__(name, address, terminator='\n', **kwargs)
+        _tune_visa_transport(self)
         
         # OUTPUT PARAMETERS
         self.add_parameter(
             'source_enabled',
             get_cmd='OUTP?',
             set_cmd='OUTP {}',
-            val_mapping={True: 1, False: 0},
+            vals=vals.Bool(),
+            set_parser=_bool_to_01,
+            get_parser=_parse_01,
             docstring='Control whether the source is enabled'
         )
         
@@ -49,7 +378,7 @@ class Keithley6221(VisaInstrument):
             'output',
             get_cmd='OUTP?',
             set_cmd='OUTP {}',
-            val_mapping={'ON': 1, 'OFF': 0},
+            val_mapping=_ONOFF_01,
             docstring='Output state (backward compatibility)'
         )
         
@@ -57,7 +386,7 @@ class Keithley6221(VisaInstrument):
             'shield_to_guard_enabled',
             get_cmd=':OUTP:ISH?',
             set_cmd=':OUTP:ISH {}',
-            val_mapping={True: 'GUAR', False: 'OLOW'},
+            val_mapping=_SHIELD_MAP,
             docstring='Control if shield is connected to the guard'
         )
         
@@ -74,29 +403,26 @@ class Keithley6221(VisaInstrument):
             'output_low_grounded',
             get_cmd=':OUTP:LTE?',
             set_cmd=':OUTP:LTE {}',
-            val_mapping={True: 1, False: 0},
+            vals=vals.Bool(),
+            set_parser=_bool_to_01,
+            get_parser=_parse_01,
             docstring='Whether low output is connected to earth ground or floating'
         )
         
         # SOURCE PARAMETERS
         self.add_parameter(
             'source_current',
+            parameter_class=DeduplicatingParameter,
             get_cmd=':SOUR:CURR?',
-            set_cmd=':SOUR:CURR {:.9f}',
+            set_cmd=self._set_source_current,
+            get_parser=float,
             unit='A',
-            vals=vals.Numbers(-0.105, 0.105),
+            vals=_CURR_RANGE,
             docstring='Source current level'
         )
         
-        # Backward compatibility alias
-        self.add_parameter(
-            'current',
-            get_cmd='SOUR:CURR?',
-            set_cmd='SOUR:CURR {:.9f}',
-            unit='A',
-            vals=vals.Numbers(-0.105, 0.105),
-            docstring='Current source level (backward compatibility)'
-        )
+        # Backward compatibility alias (same parameter object)
+        self.parameters['current'] = self.parameters['source_current']
         
         self.add_parameter(
             'source_compliance',
@@ -122,7 +448,7 @@ class Keithley6221(VisaInstrument):
             get_cmd=':SOUR:CURR:RANG?',
             set_cmd=':SOUR:CURR:RANG:AUTO 0;:SOUR:CURR:RANG {:.6f}',
             unit='A',
-            vals=vals.Numbers(-0.105, 0.105),
+            vals=_CURR_RANGE,
             docstring='Source current range (auto-range disabled when set)'
         )
         
@@ -140,7 +466,9 @@ class Keithley6221(VisaInstrument):
             'source_auto_range',
             get_cmd=':SOUR:CURR:RANG:AUTO?',
             set_cmd=':SOUR:CURR:RANG:AUTO {}',
-            val_mapping={True: 1, False: 0},
+            vals=vals.Bool(),
+            set_parser=_bool_to_01,
+            get_parser=_parse_01,
             docstring='Auto range of the current source'
         )
         
@@ -149,14 +477,14 @@ class Keithley6221(VisaInstrument):
             'delta_unit',
             get_cmd=':UNIT:VOLT:DC?',
             set_cmd=':UNIT:VOLT:DC {}',
-            val_mapping={'V': 'V', 'Ohms': 'OHMS', 'W': 'W', 'Siemens': 'SIEM'},
+            val_mapping=_DELTA_UNIT_MAP,
             docstring='Reading unit for delta measurements'
         )
         
         self.add_parameter(
             'delta_high_source',
             get_cmd=':SOUR:DELT:HIGH?',
-            set_cmd=':SOUR:DELT:HIGH {:.9f}',
+            set_cmd=self._set_delta_high_source,
             unit='A',
             vals=vals.Numbers(0, 0.105),
             docstring='Delta high source value in A'
@@ -165,7 +493,7 @@ class Keithley6221(VisaInstrument):
         self.add_parameter(
             'delta_low_source',
             get_cmd=':SOUR:DELT:LOW?',
-            set_cmd=':SOUR:DELT:LOW {:.9f}',
+            set_cmd=self._set_delta_low_source,
             unit='A',
             vals=vals.Numbers(-0.105, 0),
             docstring='Delta low source value in A'
@@ -199,7 +527,9 @@ class Keithley6221(VisaInstrument):
             'delta_compliance_abort_enabled',
             get_cmd=':SOUR:DELT:CAB?',
             set_cmd=':SOUR:DELT:CAB {}',
-            val_mapping={True: 'ON', False: 'OFF'},
+            vals=vals.Bool(),
+            set_parser=_bool_to_onoff,
+            get_parser=_parse_onoff,
             docstring='Whether compliance abort is enabled for delta mode'
         )
         
@@ -208,18 +538,14 @@ class Keithley6221(VisaInstrument):
             'waveform_function',
             get_cmd=':SOUR:WAVE:FUNC?',
             set_cmd=':SOUR:WAVE:FUNC {}',
-            val_mapping={
-                'sine': 'SIN', 'ramp': 'RAMP', 'square': 'SQU',
-                'arbitrary1': 'ARB1', 'arbitrary2': 'ARB2', 
-                'arbitrary3': 'ARB3', 'arbitrary4': 'ARB4'
-            },
+            val_mapping=_WAVE_FUNC,
             docstring='Selected wave function'
         )
         
         self.add_parameter(
             'waveform_frequency',
             get_cmd=':SOUR:WAVE:FREQ?',
-            set_cmd=':SOUR:WAVE:FREQ {:.6f}',
+            set_cmd=self._set_waveform_frequency,
             unit='Hz',
             vals=vals.Numbers(1e-3, 1e5),
             docstring='Frequency of the waveform in Hz'
@@ -228,7 +554,7 @@ class Keithley6221(VisaInstrument):
         self.add_parameter(
             'waveform_amplitude',
             get_cmd=':SOUR:WAVE:AMPL?',
-            set_cmd=':SOUR:WAVE:AMPL {:.9f}',
+            set_cmd=self._set_waveform_amplitude,
             unit='A',
             vals=vals.Numbers(2e-12, 0.105),
             docstring='Peak amplitude of the waveform in Amps'
@@ -239,7 +565,7 @@ class Keithley6221(VisaInstrument):
             get_cmd=':SOUR:WAVE:OFFS?',
             set_cmd=':SOUR:WAVE:OFFS {:.9f}',
             unit='A',
-            vals=vals.Numbers(-0.105, 0.105),
+            vals=_CURR_RANGE,
             docstring='Offset of the waveform in Amps'
         )
         
@@ -273,7 +599,7 @@ class Keithley6221(VisaInstrument):
             'waveform_ranging',
             get_cmd=':SOUR:WAVE:RANG?',
             set_cmd=':SOUR:WAVE:RANG {}',
-            val_mapping={'best': 'BEST', 'fixed': 'FIX'},
+            val_mapping=_WAVE_RANGING_MAP,
             docstring='Source ranging of the waveform'
         )
         
@@ -315,15 +641,44 @@ class Keithley6221(VisaInstrument):
             'display_enabled',
             get_cmd=':DISP:ENAB?',
             set_cmd=':DISP:ENAB {}',
-            val_mapping={True: 1, False: 0},
+            vals=vals.Bool(),
+            set_parser=_bool_to_01,
+            get_parser=_parse_01,
             docstring='Whether the display is enabled'
         )
         
+        # Cached result of delta_connected(); None until queried
+        self._delta_connected: Optional[bool] = None
+        # Whether the buffer can be read as binary float32; None until tried
+        self._binary_trace: Optional[bool] = None
+        
         self.connect_message()
+        
+    def invalidate_capability_cache(self) -> None:
+        """Forget cached capability queries so they are re-read on next use."""
+        self._delta_connected = None
+        
+    # Setters for frequently swept parameters use f-strings instead of
+    # QCoDeS set_cmd templates to keep per-setpoint overhead low
+    def _set_source_current(self, value: float) -> None:
+        self.write(f':SOUR:CURR {value:.9f}')
+        
+    def _set_delta_high_source(self, value: float) -> None:
+        self.write(f':SOUR:DELT:HIGH {value:.9f}')
+        
+    def _set_delta_low_source(self, value: float) -> None:
+        self.write(f':SOUR:DELT:LOW {value:.9f}')
+        
+    def _set_waveform_frequency(self, value: float) -> None:
+        self.write(f':SOUR:WAVE:FREQ {value:.6f}')
+        
+    def _set_waveform_amplitude(self, value: float) -> None:
+        self.write(f':SOUR:WAVE:AMPL {value:.9f}')
     
     # DELTA MODE METHODS
     def delta_arm(self) -> None:
         """Arm delta mode."""
+        self.invalidate_capability_cache()
         self.write(':SOUR:DELT:ARM')
         
     def delta_start(self) -> None:
@@ -332,20 +687,60 @@ class Keithley6221(VisaInstrument):
         
     def delta_abort(self) -> None:
         """Stop delta and place the Model 2182A in local mode."""
+        self.invalidate_capability_cache()
         self.write(':SOUR:SWE:ABOR')
     
     def delta_sense(self) -> float:
         """Get the latest delta reading results from 2182/2182A."""
         return float(self.ask(':SENS:DATA?'))
         
-    def delta_values(self) -> List[float]:
-        """Get delta sense readings stored in 6221 buffer."""
-        response = self.ask(':TRAC:DATA?')
-        return [float(x) for x in response.split(',')]
+    async def delta_sense_async(self) -> float:
+        """Get the latest delta reading without blocking the event loop."""
+        return float(await self._ask_async(':SENS:DATA?'))
+        
+    async def source_current_async(self) -> float:
+        """Get the source current level without blocking the event loop."""
+        return float(await self._ask_async(':SOUR:CURR?'))
+        
+    def delta_values(self) -> 'np.ndarray':
+        """
+        Get delta sense readings stored in 6221 buffer.
+        
+        The buffer is transferred as little-endian float32 (4 bytes per
+        reading instead of ~12 ASCII characters), which is below the
+        nanovolt noise floor. Falls back to ASCII if the instrument does
+        not accept the binary format.
+        """
+        import numpy as np
+        
+        with self._io_lock:  # keep the format switch and the read together
+            if self._binary_trace is not False:
+                self.write(':FORM:DATA REAL,32;:FORM:BORD SWAP')
+                if self._binary_trace is None:
+                    self._binary_trace = self.ask(':FORM:DATA?').strip().upper().startswith('REAL')
+                if self._binary_trace:
+                    # The binary query bypasses ask(), so send queued writes here
+                    self._flush_write_batch()
+                    try:
+                        return self.visa_handle.query_binary_values(
+                            ':TRAC:DATA?', datatype='f', is_big_endian=False,
+                            container=np.ndarray, chunk_size=_BULK_CHUNK_SIZE)
+                    finally:
+                        # Other queries (e.g. :SENS:DATA?) expect ASCII replies
+                        self.write(':FORM:DATA ASC')
+            response = self.ask(':TRAC:DATA?')
+            return np.fromstring(response, dtype=np.float64, sep=',')
         
     def delta_connected(self) -> bool:
-        """Get connection status to 2182A."""
-        return bool(int(self.ask(':SOUR:DELT:NVPR?')))
+        """
+        Get connection status to 2182A.
+        
+        The result is cached until invalidate_capability_cache() is called,
+        which delta_arm() and delta_abort() do automatically.
+        """
+        if self._delta_connected is None:
+            self._delta_connected = bool(int(self.ask(':SOUR:DELT:NVPR?')))
+        return self._delta_connected
     
     # WAVEFORM METHODS  
     def waveform_arm(self) -> None:
@@ -364,7 +759,7 @@ class Keithley6221(VisaInstrument):
         """Set the waveform duration to infinity."""
         self.write(':SOUR:WAVE:DUR:TIME INF')
         
-    def define_arbitrary_waveform(self, datapoints: Union[List[float], np.ndarray], 
+    def define_arbitrary_waveform(self, datapoints: Union[List[float], 'np.ndarray'], 
                                  location: int = 1) -> None:
         """
         Define the data points for arbitrary waveform and copy to storage location.
@@ -374,27 +769,29 @@ class Keithley6221(VisaInstrument):
                        100 points maximum
             location: Integer storage location (1-4) to store the waveform
         """
+        import numpy as np
+        
         # Validate parameters
         if not isinstance(datapoints, (list, np.ndarray)):
             raise ValueError("datapoints must be a list or numpy array")
-        elif len(datapoints) > 100:
+        points = np.asarray(datapoints, dtype=np.float64).ravel()
+        if points.size > 100:
             raise ValueError("datapoints cannot be longer than 100 points")
-        elif not all([x >= -1 and x <= 1 for x in datapoints]):
+        elif not np.all((points >= -1) & (points <= 1)):
             raise ValueError("all data points must be between -1 and 1")
             
         if location not in [1, 2, 3, 4]:
             raise ValueError("location must be in [1, 2, 3, 4]")
             
-        # Convert to strings and create comma-separated data
-        datapoints_str = [str(x) for x in datapoints]
-        data = ", ".join(datapoints_str)
+        # Format all points in one vectorized call
+        data = ", ".join(np.char.mod('%.9g', points))
         
-        # Write the data points and copy to specified location
-        self.write(f':SOUR:WAVE:ARB:DATA {data}')
-        self.write(f':SOUR:WAVE:ARB:COPY {location}')
-        
-        # Select the newly made arbitrary waveform as waveform function
-        self.waveform_function(f'arbitrary{location}')
+        # Write the data points, copy them to the specified location and
+        # select the new waveform as waveform function in one message
+        with self.batched_write():
+            self.write(f':SOUR:WAVE:ARB:DATA {data}')
+            self.write(f':SOUR:WAVE:ARB:COPY {location}')
+            self.waveform_function(f'arbitrary{location}')
         
     # TRIGGER METHODS
     def trigger(self) -> None:
@@ -481,15 +878,19 @@ class Keithley6221(VisaInstrument):
         """
         if not (65 <= base_frequency <= 1.3e6):
             raise ValueError("base_frequency must be between 65 Hz and 1.3 MHz")
-        self.beep(base_frequency, duration)
-        time.sleep(duration)
-        self.beep(base_frequency * 5.0 / 4.0, duration) 
-        time.sleep(duration)
-        self.beep(base_frequency * 6.0 / 4.0, duration)
+        if not (0 <= duration <= 7.9):
+            raise ValueError("duration must be between 0 and 7.9 seconds")
+        # The instrument plays queued beeps in sequence, so send all three
+        # notes in one message and return without sleeping
+        self.write(';'.join(f':SYST:BEEP {base_frequency * ratio:g}, {duration:g}'
+                            for ratio in (1.0, 5.0 / 4.0, 6.0 / 4.0)))
         
     def reset(self) -> None:
         """Reset instrument to default state and clear queue."""
-        self.write('status:queue:clear;*RST;:stat:pres;:*CLS;')
+        self.invalidate_capability_cache()
+        _forget_setpoints(self)
+        # *OPC? returns once the reset has completed
+        self.ask('status:queue:clear;*RST;:stat:pres;:*CLS;*OPC?')
         
     def configure_delta_mode(self, high_current: float, low_current: float, 
                            delta_delay: float = 0.001) -> None:
@@ -501,12 +902,17 @@ class Keithley6221(VisaInstrument):
             low_current: Low current level in A  
             delta_delay: Delay between current levels in seconds
         """
+        import warnings
         warnings.warn("configure_delta_mode is deprecated. Use delta_* parameters instead.", 
                      DeprecationWarning, stacklevel=2)
-        self.delta_high_source(high_current)
-        self.delta_low_source(low_current) 
-        self.delta_delay(delta_delay)
-        self.write('SOUR:DELT:STAT ON')
+        self.delta_high_source.validate(high_current)
+        self.delta_low_source.validate(low_current)
+        self.delta_delay.validate(delta_delay)
+        # Single compound message instead of one transaction per setting
+        self.write(f':SOUR:DELT:HIGH {high_current:.9f};'
+                   f':SOUR:DELT:LOW {low_current:.9f};'
+                   f':SOUR:DELT:DEL {delta_delay};'
+                   f':SOUR:DELT:STAT ON')
         
     def shutdown(self) -> None:
         """Disable output and shutdown."""
@@ -514,7 +920,122 @@ class Keithley6221(VisaInstrument):
         super().shutdown()
 
 
-class Keithley2182A(VisaInstrument):
+def _add_2182a_base_parameters(instrument: VisaInstrument,
+                               read_cmd: Union[str, Callable[[], float]] = ':READ?') -> None:
+    """
+    Add the voltage measurement parameters shared by both 2182A drivers.
+    
+    Registers voltage, voltage_range, voltage_nplc, channel and auto_range.
+    The legacy name nplc refers to the same parameter object as
+    voltage_nplc rather than to a second parameter with the same command.
+    ``read_cmd`` is the get command of the voltage reading.
+    """
+    instrument.add_parameter(
+        'voltage',
+        get_cmd=read_cmd,
+        unit='V',
+        docstring='Measure voltage if active channel is configured for this reading'
+    )
+    
+    instrument.add_parameter(
+        'voltage_range',
+        get_cmd=':SENS:VOLT:RANG?',
+        set_cmd=':SENS:VOLT:RANG {:.6f}',
+        unit='V',
+        vals=vals.Numbers(10e-9, 100),
+        docstring='Voltage measurement range'
+    )
+    
+    instrument.add_parameter(
+        'voltage_nplc',
+        get_cmd=':SENS:VOLT:NPLC?',
+        set_cmd=':SENS:VOLT:NPLC {:.3f}',
+        vals=vals.Numbers(0.01, 60),
+        docstring='Number of power line cycles (NPLC) for voltage measurements'
+    )
+    # Backward compatibility alias
+    instrument.parameters['nplc'] = instrument.parameters['voltage_nplc']
+    
+    instrument.add_parameter(
+        'channel',
+        get_cmd=':SENS:CHAN?',
+        set_cmd=':SENS:CHAN {}',
+        vals=vals.Ints(1, 2),
+        docstring='Input channel selection'
+    )
+    
+    instrument.add_parameter(
+        'auto_range',
+        get_cmd=':SENS:VOLT:RANG:AUTO?',
+        set_cmd=':SENS:VOLT:RANG:AUTO {}',
+        val_mapping=_ONOFF_01,
+        docstring='Auto range state'
+    )
+
+
+def _read_2182a_trace(instrument: VisaInstrument) -> 'np.ndarray':
+    """
+    Read the 2182A reading buffer as a NumPy array.
+    
+    The buffer is transferred as little-endian single precision floats
+    (:FORM:DATA SRE) and parsed without ASCII conversion. Falls back to
+    ASCII if the instrument does not accept the binary format.
+    """
+    import numpy as np
+    
+    with instrument._io_lock:  # keep the format switch and the read together
+        if instrument._binary_readings:
+            # The binary query bypasses ask(), so send queued writes here
+            instrument._flush_write_batch()
+            return instrument.visa_handle.query_binary_values(
+                ':TRAC:DATA?', datatype='f', is_big_endian=False,
+                container=np.ndarray, chunk_size=_BULK_CHUNK_SIZE)
+        # Switching the format through ask() also sends any queued writes
+        fmt = instrument.ask(':FORM:DATA SRE;:FORM:BORD SWAP;:FORM:DATA?')
+        if fmt.strip().upper().startswith('SRE'):
+            try:
+                return instrument.visa_handle.query_binary_values(
+                    ':TRAC:DATA?', datatype='f', is_big_endian=False,
+                    container=np.ndarray, chunk_size=_BULK_CHUNK_SIZE)
+            finally:
+                # Other queries (e.g. :READ?) expect ASCII replies
+                instrument.write(':FORM:DATA ASC')
+        return np.fromstring(instrument.ask(':TRAC:DATA?'), dtype=np.float64, sep=',')
+
+
+def _buffered_mean(instrument: VisaInstrument, count: int) -> float:
+    """
+    Acquire ``count`` readings into the 2182A buffer and return their mean.
+    
+    The readings are taken with a single trigger and averaged by the
+    firmware, so the whole acquisition costs a few queries instead of
+    one query per reading.
+    """
+    # Allow up to 2 s per reading (50 NPLC with auto zero) for the acquisition
+    timeout = instrument.timeout()
+    if timeout is not None:
+        timeout += 2.0 * count
+    try:
+        with instrument.timeout.set_to(timeout):
+            instrument.write(f':TRAC:CLE;:TRAC:POIN {count};:TRAC:FEED SENS;'
+                             f':TRAC:FEED:CONT NEXT;:SAMP:COUN {count};:INIT')
+            instrument.ask('*OPC?')
+        mean_cmd = ':CALC2:FORM MEAN;:CALC2:STAT ON;:CALC2:IMM?'
+        try:
+            if instrument._binary_readings:
+                return instrument._query_reading(mean_cmd)
+            return float(instrument.ask(mean_cmd))
+        except VisaIOError:
+            # Buffer statistics unavailable; average the raw buffer instead,
+            # accumulating in double precision (binary readings are float32)
+            import numpy as np
+            return float(_read_2182a_trace(instrument).mean(dtype=np.float64))
+    finally:
+        # READ? returns one value per sample, so restore single sampling
+        instrument.write(':SAMP:COUN 1')
+
+
+class Keithley2182A(_CachedIdnMixin, _LockedIOMixin, VisaInstrument):
     """
     QCoDeS driver for Keithley 2182A Nanovoltmeter.
     
@@ -522,6 +1043,9 @@ class Keithley2182A(VisaInstrument):
     and low-voltage applications.
     """
     
+    # Readings are always transferred as ASCII
+    _binary_readings = False
+    
     def __init__(self, name: str, address: str, **kwargs):
         """
         Initialize Keithley 2182A nanovoltmeter.
@@ -531,58 +1055,17 @@ class Keithley2182A(VisaInstrument):
             address: VISA resource address
         """
         super().__init__(name, address, terminator='\n', **kwargs)
+        _tune_visa_transport(self)
         
-        # Voltage measurement parameter
-        self.add_parameter(
-            'voltage',
-            get_cmd='READ?',
-            unit='V',
-            docstring='Measured voltage'
-        )
-        
-        # Voltage range
-        self.add_parameter(
-            'voltage_range',
-            get_cmd='SENS:VOLT:RANG?',
-            set_cmd='SENS:VOLT:RANG {:.6f}',
-            unit='V',
-            vals=vals.Numbers(10e-9, 100),
-            docstring='Voltage measurement range'
-        )
-        
-        # Integration time/NPLC
-        self.add_parameter(
-            'nplc',
-            get_cmd='SENS:VOLT:NPLC?',
-            set_cmd='SENS:VOLT:NPLC {:.3f}',
-            vals=vals.Numbers(0.01, 50),
-            docstring='Integration time in number of power line cycles'
-        )
-        
-        # Channel selection
-        self.add_parameter(
-            'channel',
-            get_cmd='SENS:CHAN?',
-            set_cmd='SENS:CHAN {}',
-            vals=vals.Ints(1, 2),
-            docstring='Input channel selection'
-        )
-        
-        # Auto range
-        self.add_parameter(
-            'auto_range',
-            get_cmd='SENS:VOLT:RANG:AUTO?',
-            set_cmd='SENS:VOLT:RANG:AUTO {}',
-            val_mapping={'ON': 1, 'OFF': 0},
-            docstring='Auto range state'
-        )
+        # Voltage, range, NPLC, channel and auto range parameters
+        _add_2182a_base_parameters(self)
         
         self.connect_message()
         
     def configure_delta_mode(self) -> None:
         """Configure for delta mode measurements with K6221."""
-        self.write('SENS:VOLT:DFIL:STAT ON')  # Enable delta filter
-        self.write('SENS:VOLT:LPAS:STAT OFF') # Disable low pass filter
+        # Enable delta filter, disable low pass filter
+        self.write(':SENS:VOLT:DFIL:STAT ON;:SENS:VOLT:LPAS:STAT OFF')
         
     def take_measurement(self, average_count: int = 1) -> float:
         """
@@ -597,11 +1080,7 @@ class Keithley2182A(VisaInstrument):
         if average_count == 1:
             return float(self.ask('READ?'))
         
-        measurements = []
-        for _ in range(average_count):
-            measurements.append(float(self.ask('read?')))
-            
-        return sum(measurements) / len(measurements)
+        return _buffered_mean(self, average_count)
 
 
 class Keithley2182AChannel:
@@ -684,11 +1163,12 @@ class Keithley2182AChannel:
             auto_range: Enable auto_range if True, else use set voltage range
             nplc: Number of power line cycles (NPLC) from 0.01 to 50/60
         """
-        self.parent.write(f':SENS:CHAN {self.channel};'
-                         f':SENS:FUNC "VOLT";'
-                         f':SENS:VOLT:NPLC {nplc};')
+        cmd = (f':SENS:CHAN {self.channel};'
+               f':SENS:FUNC "VOLT";'
+               f':SENS:VOLT:NPLC {nplc}')
         if auto_range:
-            self.parent.write(':SENS:VOLT:RANG:AUTO 1')
+            cmd += ';:SENS:VOLT:RANG:AUTO 1'
+        self.parent.write(cmd)
             
     def setup_temperature(self, nplc: float = 5) -> None:
         """
@@ -711,7 +1191,8 @@ class Keithley2182AChannel:
 
 
 # ENHANCED Keithley2182A with enhanced functionality while maintaining backward compatibility
-class Keithley2182AEnhanced(VisaInstrument):
+class Keithley2182AEnhanced(_CompoundStateMixin, _AsyncQueryMixin, _BatchedWriteMixin,
+                            _CachedIdnMixin, _LockedIOMixin, VisaInstrument):
     """
     Enhanced QCoDeS driver for Keithley 2182A Nanovoltmeter.
     
@@ -725,9 +1206,30 @@ class Keithley2182AEnhanced(VisaInstrument):
         **kwargs: Additional arguments passed to VisaInstrument
     """
     
+    # Parameters refreshed together by refresh_state(); readings such as
+    # voltage and temperature trigger a measurement and are not included
+    _STATE_QUERIES = {
+        'auto_zero_enabled': ':SYST:AZER:STAT?',
+        'display_enabled': ':DISP:ENAB?',
+        'active_channel': ':SENS:CHAN?',
+        'channel': ':SENS:CHAN?',
+        'channel_function': ':SENS:FUNC?',
+        'voltage_nplc': ':SENS:VOLT:NPLC?',
+        'nplc': ':SENS:VOLT:NPLC?',
+        'voltage_range': ':SENS:VOLT:RANG?',
+        'auto_range': ':SENS:VOLT:RANG:AUTO?',
+        'thermocouple': ':SENS:TEMP:TC?',
+        'temperature_nplc': ':SENS:TEMP:NPLC?',
+        'temperature_reference_junction': ':SENS:TEMP:RJUN:RSEL?',
+        'temperature_simulated_reference': ':SENS:TEMP:RJUN:SIM?',
+        'trigger_count': ':TRIG:COUN?',
+        'trigger_delay': ':TRIG:DEL?',
+    }
+    
     def __init__(self, name: str, address: str, **kwargs):
         """Initialize enhanced Keithley 2182A nanovoltmeter."""
         super().__init__(name, address, terminator='\r', **kwargs)
+        _tune_visa_transport(self)
         
         # Create channel objects
         self.ch_1 = Keithley2182AChannel(self, 1)
@@ -738,7 +1240,9 @@ class Keithley2182AEnhanced(VisaInstrument):
             'auto_zero_enabled',
             get_cmd=':SYST:AZER:STAT?',
             set_cmd=':SYST:AZER:STAT {}',
-            val_mapping={True: 1, False: 0},
+            vals=vals.Bool(),
+            set_parser=_bool_to_01,
+            get_parser=_parse_01,
             docstring='Control the auto zero option'
         )
         
@@ -746,7 +1250,9 @@ class Keithley2182AEnhanced(VisaInstrument):
             'display_enabled',
             get_cmd=':DISP:ENAB?',
             set_cmd=':DISP:ENAB {}',
-            val_mapping={True: 1, False: 0},
+            vals=vals.Bool(),
+            set_parser=_bool_to_01,
+            get_parser=_parse_01,
             docstring='Control whether the front display is enabled'
         )
         
@@ -758,69 +1264,22 @@ class Keithley2182AEnhanced(VisaInstrument):
             docstring='Control which channel is active for measurement (0=internal, 1, 2)'
         )
         
-        # Backward compatibility alias
-        self.add_parameter(
-            'channel',
-            get_cmd='SENS:CHAN?',
-            set_cmd='SENS:CHAN {}',
-            vals=vals.Ints(1, 2),
-            docstring='Input channel selection (backward compatibility)'
-        )
-        
         self.add_parameter(
             'channel_function',
             get_cmd=':SENS:FUNC?',
             set_cmd=':SENS:FUNC {}',
-            val_mapping={'voltage': '"VOLT:DC"', 'temperature': '"TEMP"'},
+            val_mapping=_CHANNEL_FUNC_MAP,
             docstring='Measurement mode of the active channel'
         )
         
-        # VOLTAGE PARAMETERS
-        self.add_parameter(
-            'voltage',
-            get_cmd=':READ?',
-            unit='V',
-            docstring='Measure voltage if active channel is configured for this reading'
-        )
-        
-        self.add_parameter(
-            'voltage_nplc',
-            get_cmd=':SENS:VOLT:NPLC?',
-            set_cmd=':SENS:VOLT:NPLC {:.3f}',
-            vals=vals.Numbers(0.01, 60),
-            docstring='Number of power line cycles (NPLC) for voltage measurements'
-        )
-        
-        # Backward compatibility aliases
-        self.add_parameter(
-            'nplc',
-            get_cmd='SENS:VOLT:NPLC?',
-            set_cmd='SENS:VOLT:NPLC {:.3f}',
-            vals=vals.Numbers(0.01, 50),
-            docstring='Integration time in number of power line cycles (backward compatibility)'
-        )
-        
-        self.add_parameter(
-            'voltage_range',
-            get_cmd='SENS:VOLT:RANG?',
-            set_cmd='SENS:VOLT:RANG {:.6f}',
-            unit='V',
-            vals=vals.Numbers(10e-9, 100),
-            docstring='Voltage measurement range (backward compatibility)'
-        )
-        
-        self.add_parameter(
-            'auto_range',
-            get_cmd='SENS:VOLT:RANG:AUTO?',
-            set_cmd='SENS:VOLT:RANG:AUTO {}',
-            val_mapping={'ON': 1, 'OFF': 0},
-            docstring='Auto range state (backward compatibility)'
-        )
+        # VOLTAGE PARAMETERS (voltage, voltage_range, voltage_nplc/nplc,
+        # channel and auto_range)
+        _add_2182a_base_parameters(self, read_cmd=self._read)
         
         # TEMPERATURE PARAMETERS
         self.add_parameter(
             'temperature',
-            get_cmd=':READ?',
+            get_cmd=self._read,
             unit='C',
             docstring='Measure temperature if active channel is configured for this reading'
         )
@@ -876,33 +1335,105 @@ class Keithley2182AEnhanced(VisaInstrument):
             docstring='Trigger delay in seconds'
         )
         
+        # Cached result of line_frequency(); None until queried
+        self._line_frequency: Optional[float] = None
+        
+        self._enable_binary()
         self.connect_message()
         
+    def _enable_binary(self) -> None:
+        """
+        Switch readings to binary single precision floats if supported.
+        
+        Readings (READ?, CALC2:IMM?, TRAC:DATA?) are then transferred as
+        little-endian IEEE-488.2 blocks and parsed without ASCII conversion.
+        Configuration queries are not affected by the data format.
+        """
+        fmt = self.ask(':FORM:DATA SRE;:FORM:BORD SWAP;:FORM:DATA?')
+        self._binary_readings = fmt.strip().upper().startswith('SRE')
+        
+    def _query_reading(self, cmd: str) -> float:
+        """Query a single reading in the active data format."""
+        if not self._binary_readings:
+            return float(self.ask(cmd))
+        with self._io_lock:
+            # The binary query bypasses ask(), so send queued writes here
+            self._flush_write_batch()
+            # For non-NumPy containers pyvisa decodes the block with
+            # struct.unpack_from and still handles termination characters
+            # inside the payload, which a fixed-size raw read would not
+            return self.visa_handle.query_binary_values(
+                cmd, datatype='f', is_big_endian=False, container=tuple)[0]
+            
+    def _read(self) -> float:
+        """Trigger and return one reading of the active channel function."""
+        return self._query_reading(':READ?')
+        
+    def invalidate_capability_cache(self) -> None:
+        """Forget cached capability queries so they are re-read on next use."""
+        self._line_frequency = None
+        
     # MEASUREMENT METHODS
     def line_frequency(self) -> float:
-        """Get the line frequency in Hertz (50 or 60 Hz)."""
-        return float(self.ask(':SYST:LFR?'))
+        """Get the line frequency in Hertz (50 or 60 Hz), queried once."""
+        if self._line_frequency is None:
+            self._line_frequency = float(self.ask(':SYST:LFR?'))
+        return self._line_frequency
         
     def internal_temperature(self) -> float:
         """Measure the internal temperature in Celsius."""
         return float(self.ask(':SENS:TEMP:RTEM?'))
         
+    async def voltage_async(self) -> float:
+        """
+        Measure voltage without blocking the event loop.
+        
+        Example:
+            v, i = await asyncio.gather(nvm.voltage_async(),
+                                        source.source_current_async())
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read)
+        
     # STATISTICS METHODS  
     def mean(self) -> float:
         """Get calculated mean (average) from buffer data."""
-        return float(self.ask(':CALC2:FORM MEAN;:CALC2:STAT ON;:CALC2:IMM?;'))
+        return self._query_reading(':CALC2:FORM MEAN;:CALC2:STAT ON;:CALC2:IMM?')
         
     def maximum(self) -> float:
         """Get calculated maximum from buffer data.""" 
-        return float(self.ask(':CALC2:FORM MAX;:CALC2:STAT ON;:CALC2:IMM?;'))
+        return self._query_reading(':CALC2:FORM MAX;:CALC2:STAT ON;:CALC2:IMM?')
         
     def minimum(self) -> float:
         """Get calculated minimum from buffer data."""
-        return float(self.ask(':CALC2:FORM MIN;:CALC2:STAT ON;:CALC2:IMM?;'))
+        return self._query_reading(':CALC2:FORM MIN;:CALC2:STAT ON;:CALC2:IMM?')
         
     def standard_dev(self) -> float:
         """Get calculated standard deviation from buffer data."""
-        return float(self.ask(':CALC2:FORM SDEV;:CALC2:STAT ON;:CALC2:IMM?;'))
+        return self._query_reading(':CALC2:FORM SDEV;:CALC2:STAT ON;:CALC2:IMM?')
+        
+    def statistics(self) -> Dict[str, float]:
+        """
+        Get mean, maximum, minimum and standard deviation of the buffer data.
+        
+        The buffer is read once and all four values are computed locally,
+        instead of one CALC2 query per statistic.
+        
+        Returns:
+            Dictionary with 'mean', 'maximum', 'minimum' and 'standard_dev'
+        """
+        import numpy as np
+        
+        data = _read_2182a_trace(self).astype(np.float64)
+        if data.size == 0:
+            raise ValueError("The reading buffer is empty")
+        return {
+            'mean': float(data.mean()),
+            'maximum': float(data.max()),
+            'minimum': float(data.min()),
+            # Sample standard deviation, as computed by CALC2 SDEV
+            'standard_dev': float(data.std(ddof=1)) if data.size > 1 else 0.0,
+        }
         
     # TRIGGER METHODS
     def trigger(self) -> None:
@@ -920,6 +1451,7 @@ class Keithley2182AEnhanced(VisaInstrument):
     def sample_continuously(self) -> None:
         """Configure instrument to continuously read samples."""
         # This method would need buffer management which isn't fully implemented
+        import warnings
         warnings.warn("sample_continuously requires buffer management - not fully implemented", 
                      UserWarning, stacklevel=2)
         self.trigger_immediately()
@@ -934,21 +1466,60 @@ class Keithley2182AEnhanced(VisaInstrument):
         # we would update the parameter validators)
         self._max_nplc = max_nplc
         
+    @contextmanager
+    def fast_mode(self, disable_auto_zero: bool = True) -> Iterator[None]:
+        """
+        Turn off the front display (and auto zero) for the duration of a block.
+        
+        Display updates take time from the measurement cycle; without auto
+        zero readings are faster at the cost of slow drift.
+        The previous settings are restored when the block exits.
+        
+        Args:
+            disable_auto_zero: Also turn auto zero off
+            
+        Example:
+            with nvm.fast_mode():
+                data = [nvm.voltage() for _ in range(1000)]
+        """
+        display, auto_zero = (_parse_01(r) for r in
+                              self.ask(':DISP:ENAB?;:SYST:AZER:STAT?').split(';'))
+        with self.batched_write():
+            self.display_enabled(False)
+            if disable_auto_zero:
+                self.auto_zero_enabled(False)
+        try:
+            yield
+        finally:
+            with self.batched_write():
+                self.display_enabled(display)
+                if disable_auto_zero:
+                    self.auto_zero_enabled(auto_zero)
+        
     def reset(self) -> None:
         """Reset the instrument and clear the queue."""
-        self.write('status:queue:clear;*RST;:stat:pres;:*CLS;')
+        self.invalidate_capability_cache()
+        # *OPC? returns once the reset has completed
+        self.ask('status:queue:clear;*RST;:stat:pres;:*CLS;*OPC?')
+        # *RST restores ASCII readings
+        self._enable_binary()
         
     def configure_delta_mode(self) -> None:
         """Configure for delta mode measurements with K6221 (backward compatibility)."""
+        import warnings
         warnings.warn("configure_delta_mode is deprecated. Use manual SCPI commands if needed.", 
                      DeprecationWarning, stacklevel=2)
-        self.write('SENS:VOLT:DFIL:STAT ON')  # Enable delta filter
-        self.write('SENS:VOLT:LPAS:STAT OFF') # Disable low pass filter
+        # Enable delta filter, disable low pass filter
+        self.write(':SENS:VOLT:DFIL:STAT ON;:SENS:VOLT:LPAS:STAT OFF')
         
     def take_measurement(self, average_count: int = 1) -> float:
         """
         Take voltage measurement with optional averaging (backward compatibility).
         
+        Multiple readings are acquired into the instrument buffer with a
+        single trigger and averaged by the firmware, instead of one query
+        per reading.
+        
         Args:
             average_count: Number of measurements to average
             
@@ -956,13 +1527,9 @@ class Keithley2182AEnhanced(VisaInstrument):
             Averaged voltage measurement
         """
         if average_count == 1:
-            return float(self.ask('read?'))
+            return self._read()
         
-        measurements = []
-        for _ in range(average_count):
-            measurements.append(float(self.ask('read?')))
-            
-        return sum(measurements) / len(measurements)
+        return _buffered_mean(self, average_count)
 
     
 # Alias enhanced version to the original name for backward compatibility 
@@ -970,14 +1537,33 @@ class Keithley2182AEnhanced(VisaInstrument):
 Keithley2182A = Keithley2182AEnhanced
 
 
-class Keithley2636B(VisaInstrument):
+class Keithley2636B(_CachedIdnMixin, _LockedIOMixin, VisaInstrument):
     """
     QCoDeS driver for Keithley 2636B Dual Channel Source Measure Unit.
     
     Provides voltage/current sourcing and measurement capabilities
     for both channels A and B.
+    
+    Over LAN, the raw socket address 'TCPIP::<host>::5025::SOCKET' has
+    less per-query overhead than VXI-11 ('TCPIP::<host>::INSTR').
     """
     
+    # Per-channel TSP commands, built once instead of on every call
+    _SMU = {'a': 'smua', 'b': 'smub'}
+    _IV_QUERY = {ch: f'print({smu}.measure.iv())' for ch, smu in _SMU.items()}
+    _VOLTAGE_SOURCE_CMD = {ch: f'{smu}.source.func = {smu}.OUTPUT_DCVOLTS'
+                           for ch, smu in _SMU.items()}
+    _CURRENT_SOURCE_CMD = {ch: f'{smu}.source.func = {smu}.OUTPUT_DCAMPS'
+                           for ch, smu in _SMU.items()}
+    
+    @staticmethod
+    def _lookup(table: Dict[str, str], channel: str) -> str:
+        """Get the command for ``channel`` from a per-channel table."""
+        try:
+            return table[channel]
+        except KeyError:
+            raise ValueError("channel must be 'a' or 'b'") from None
+    
     def __init__(self, name: str, address: str, **kwargs):
         """
         Initialize Keithley 2636B dual SMU.
@@ -987,12 +1573,14 @@ class Keithley2636B(VisaInstrument):
             address: VISA resource address
         """
         super().__init__(name, address, terminator='\n', **kwargs)
+        _tune_visa_transport(self)
         
         # Channel A parameters
         self.add_parameter(
             'voltage_a',
+            parameter_class=DeduplicatingParameter,
             get_cmd='print(smua.measure.v())',
-            set_cmd='smua.source.levelv = {:.6f}',
+            set_cmd=self._set_voltage_a,
             unit='V',
             vals=vals.Numbers(-200, 200),
             docstring='Channel A voltage'
@@ -1000,8 +1588,9 @@ class Keithley2636B(VisaInstrument):
         
         self.add_parameter(
             'current_a',
+            parameter_class=DeduplicatingParameter,
             get_cmd='print(smua.measure.i())',
-            set_cmd='smua.source.leveli = {:.9f}',
+            set_cmd=self._set_current_a,
             unit='A',
             vals=vals.Numbers(-1.5, 1.5),
             docstring='Channel A current'
@@ -1010,8 +1599,9 @@ class Keithley2636B(VisaInstrument):
         # Channel B parameters  
         self.add_parameter(
             'voltage_b',
+            parameter_class=DeduplicatingParameter,
             get_cmd='print(smub.measure.v())',
-            set_cmd='smub.source.levelv = {:.6f}',
+            set_cmd=self._set_voltage_b,
             unit='V', 
             vals=vals.Numbers(-200, 200),
             docstring='Channel B voltage'
@@ -1019,8 +1609,9 @@ class Keithley2636B(VisaInstrument):
         
         self.add_parameter(
             'current_b',
+            parameter_class=DeduplicatingParameter,
             get_cmd='print(smub.measure.i())',
-            set_cmd='smub.source.leveli = {:.9f}',
+            set_cmd=self._set_current_b,
             unit='A',
             vals=vals.Numbers(-1.5, 1.5),
             docstring='Channel B current'
@@ -1045,6 +1636,25 @@ class Keithley2636B(VisaInstrument):
         
         self.connect_message()
         
+    # Source level setters use f-strings instead of QCoDeS set_cmd
+    # templates to keep per-setpoint overhead low
+    def _set_voltage_a(self, value: float) -> None:
+        self.write(f'smua.source.levelv = {value:.6f}')
+        
+    def _set_current_a(self, value: float) -> None:
+        self.write(f'smua.source.leveli = {value:.9f}')
+        
+    def _set_voltage_b(self, value: float) -> None:
+        self.write(f'smub.source.levelv = {value:.6f}')
+        
+    def _set_current_b(self, value: float) -> None:
+        self.write(f'smub.source.leveli = {value:.9f}')
+        
+    def _query_values(self, cmd: str) -> List[float]:
+        """Query tab separated numbers, as printed by TSP print()."""
+        with self._io_lock:
+            return self.visa_handle.query_ascii_values(cmd, separator='\t')
+        
     def configure_voltage_source(self, channel: str = 'a') -> None:
         """
         Configure channel as voltage source.
@@ -1052,8 +1662,7 @@ class Keithley2636B(VisaInstrument):
         Args:
             channel: 'a' or 'b' for channel selection
         """
-        smu = f'smu{channel}'
-        self.write(f'{smu}.source.func = {smu}.OUTPUT_DCVOLTS')
+        self.write(self._lookup(self._VOLTAGE_SOURCE_CMD, channel))
         
     def configure_current_source(self, channel: str = 'a') -> None:
         """
@@ -1062,8 +1671,7 @@ class Keithley2636B(VisaInstrument):
         Args:
             channel: 'a' or 'b' for channel selection
         """
-        smu = f'smu{channel}'
-        self.write(f'{smu}.source.func = {smu}.OUTPUT_DCAMPS')
+        self.write(self._lookup(self._CURRENT_SOURCE_CMD, channel))
         
     def set_compliance(self, channel: str, voltage_limit: float = None,
                       current_limit: float = None) -> None:
@@ -1075,13 +1683,13 @@ class Keithley2636B(VisaInstrument):
             voltage_limit: Voltage compliance limit in V
             current_limit: Current compliance limit in A
         """
-        smu = f'smu{channel}'
+        smu = self._lookup(self._SMU, channel)
         if voltage_limit is not None:
             self.write(f'{smu}.source.limitv = {voltage_limit:.6f}')
         if current_limit is not None:
             self.write(f'{smu}.source.limiti = {current_limit:.9f}')
             
-    def measure_iv(self, channel: str) -> tuple:
+    def measure_iv(self, channel: str) -> IVPoint:
         """
         Measure current and voltage simultaneously.
         
@@ -1089,15 +1697,192 @@ class Keithley2636B(VisaInstrument):
             channel: 'a' or 'b' for channel selection
             
         Returns:
-            Tuple of (current, voltage) measurements
+            IVPoint (a (current, voltage) tuple) of the measurements
+        """
+        current, voltage = self._query_values(self._lookup(self._IV_QUERY, channel))
+        return IVPoint(current, voltage)
+    
+    def average_voltage(self, channel: str, n: int) -> float:
+        """
+        Measure the voltage ``n`` times and return the average.
+        
+        The loop runs in the instrument's TSP interpreter, so the average
+        costs one query instead of ``n``.
+        
+        Args:
+            channel: 'a' or 'b' for channel selection
+            n: Number of measurements to average
+        """
+        smu = self._lookup(self._SMU, channel)
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        n = int(n)
+        return float(self.ask(f'local r = 0 for i = 1, {n} do '
+                              f'r = r + {smu}.measure.v() end print(r / {n})'))
+    
+    def average_iv(self, channel: str, n: int) -> IVPoint:
+        """
+        Measure current and voltage ``n`` times and return the averages.
+        
+        Like average_voltage(), the loop runs on the instrument.
+        
+        Args:
+            channel: 'a' or 'b' for channel selection
+            n: Number of measurements to average
+            
+        Returns:
+            IVPoint (a (current, voltage) tuple) of the averages
+        """
+        smu = self._lookup(self._SMU, channel)
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        n = int(n)
+        current, voltage = self._query_values(
+            f'local ri, rv = 0, 0 for i = 1, {n} do '
+            f'local c, v = {smu}.measure.iv() ri = ri + c rv = rv + v end '
+            f'print(ri / {n}, rv / {n})')
+        return IVPoint(current, voltage)
+    
+    def measure_iv_both(self) -> Tuple[IVPoint, IVPoint]:
         """
-        smu = f'smu{channel}'
-        result = self.ask(f'print({smu}.measure.iv())')
-        values = result.split('\t')
-        return float(values[0]), float(values[1])
+        Measure current and voltage on both channels with a single query.
+        
+        A VISA session cannot serve two threads at once, so both channels
+        are measured by one TSP chunk instead of two parallel queries.
+        Separate instruments can be read concurrently with
+        bluefors_dc.utils.read_parallel.
         
+        Returns:
+            Tuple of IVPoints for channel A and channel B
+        """
+        # Lua keeps only the first value of a call that is not the last
+        # print() argument, so the results are unpacked into locals first
+        ia, va, ib, vb = self._query_values('local ia, va = smua.measure.iv() '
+                                            'local ib, vb = smub.measure.iv() '
+                                            'print(ia, va, ib, vb)')
+        return IVPoint(ia, va), IVPoint(ib, vb)
+    
+    def sweep_iv(self, channel: str, values: Sequence[float],
+                 dwell: Optional[float] = None) -> 'np.ndarray':
+        """
+        Sweep the source voltage through a list and measure I and V at each point.
+        
+        The sweep runs in the SMU trigger model, so all points cost one
+        write and one buffer read instead of a set and a query per point.
+        The channel is switched to voltage sourcing; the output must be on.
+        
+        Args:
+            channel: 'a' or 'b' for channel selection
+            values: Source voltages in V
+            dwell: Settling time between sourcing and measuring each point
+                   in s, timed by the SMU (default: the channel's measure delay)
+        
+        Returns:
+            Array of shape (2, len(values)) with currents and voltages
+        """
+        import numpy as np
+        
+        smu = self._lookup(self._SMU, channel)
+        points = np.asarray(values, dtype=np.float64).ravel()
+        if points.size == 0:
+            raise ValueError("values must not be empty")
+        levels = ','.join(np.char.mod('%.6g', points))
+        n = points.size
+        if dwell is None:
+            set_delay = restore_delay = ''
+        elif dwell < 0:
+            raise ValueError(f"dwell must be non-negative, got {dwell}")
+        else:
+            # Restored in the same message once the sweep has completed
+            set_delay = (f'local delay = {smu}.measure.delay '
+                         f'{smu}.measure.delay = {dwell:.6g} ')
+            restore_delay = f' {smu}.measure.delay = delay'
+        timeout = self.timeout()
+        if timeout is not None:
+            timeout += self._sweep_duration(smu, n, dwell)
+        # TSP statements are whitespace separated, so the whole sweep is one message
+        self.write(f'{set_delay}{smu}.nvbuffer1.clear() {smu}.nvbuffer2.clear() '
+                   f'{smu}.source.func = {smu}.OUTPUT_DCVOLTS '
+                   f'{smu}.trigger.source.listv({{{levels}}}) '
+                   f'{smu}.trigger.source.action = {smu}.ENABLE '
+                   f'{smu}.trigger.measure.action = {smu}.ENABLE '
+                   f'{smu}.trigger.measure.iv({smu}.nvbuffer1, {smu}.nvbuffer2) '
+                   f'{smu}.trigger.arm.count = 1 '
+                   f'{smu}.trigger.count = {n} '
+                   f'{smu}.trigger.initiate() waitcomplete(){restore_delay}')
+        # printbuffer interleaves the buffers: i1, v1, i2, v2, ...
+        # Read them as little-endian float32 instead of ASCII; the reply
+        # is an indefinite-length block (#0), so pass the expected count
+        with self._io_lock:  # keep the format switch and the read together
+            self.write('format.data = format.REAL32 '
+                       'format.byteorder = format.LITTLEENDIAN')
+            try:
+                # The reply only arrives once the sweep has completed
+                with self.timeout.set_to(timeout):
+                    data = self.visa_handle.query_binary_values(
+                        f'printbuffer(1, {n}, {smu}.nvbuffer1.readings, '
+                        f'{smu}.nvbuffer2.readings)',
+                        datatype='f', is_big_endian=False,
+                        container=np.ndarray, data_points=2 * n,
+                        chunk_size=_BULK_CHUNK_SIZE)
+            finally:
+                # print() replies elsewhere in the driver are parsed as ASCII
+                self.write('format.data = format.ASCII')
+        # The sweep leaves the source at the last list value
+        _forget_setpoints(self)
+        return data.astype(np.float64).reshape(n, 2).T
+    
+    def _sweep_duration(self, smu: str, points: int,
+                        dwell: Optional[float] = None) -> float:
+        """Upper estimate of the time a trigger-model sweep takes in s."""
+        nplc, delay, autozero, line_frequency = (
+            float(v) for v in self.ask(
+                f'print({smu}.measure.nplc, {smu}.measure.delay, '
+                f'{smu}.measure.autozero, localnode.linefreq)').split())
+        # measure.iv integrates twice; automatic auto zero (2) adds a
+        # reference and a zero integration to each
+        integrations = 6 if autozero == 2 else 2
+        if dwell is not None:
+            # The sweep replaces the measure delay by the dwell
+            delay = dwell
+        elif delay < 0:
+            # DELAY_AUTO picks a range dependent delay
+            delay = _AUTO_MEASURE_DELAY
+        per_point = integrations * nplc / line_frequency + delay
+        return points * (per_point + _SWEEP_POINT_OVERHEAD)
+    
+    @contextmanager
+    def fast_mode(self, disable_auto_zero: bool = True) -> Iterator[None]:
+        """
+        Blank the front panel (and auto zero once) for the duration of a block.
+        
+        The SMU display is switched to the user screen, which is not
+        updated with readings, and autozero is set to AUTOZERO_ONCE on both
+        channels. The previous settings are restored when the block exits.
+        
+        Args:
+            disable_auto_zero: Also stop automatic autozero
+        """
+        saved = self.ask('print(display.screen, smua.measure.autozero, '
+                         'smub.measure.autozero)').split('\t')
+        screen, autozero_a, autozero_b = (int(float(v)) for v in saved)
+        cmd = 'display.screen = display.USER display.clear()'
+        if disable_auto_zero:
+            cmd += (' smua.measure.autozero = smua.AUTOZERO_ONCE'
+                    ' smub.measure.autozero = smub.AUTOZERO_ONCE')
+        self.write(cmd)
+        try:
+            yield
+        finally:
+            cmd = f'display.screen = {screen}'
+            if disable_auto_zero:
+                cmd += (f' smua.measure.autozero = {autozero_a}'
+                        f' smub.measure.autozero = {autozero_b}')
+            self.write(cmd)
+    
     def reset(self) -> None:
         """Reset both channels to safe defaults."""
-        self.write('reset()')
-        self.write('smua.source.output = smua.OUTPUT_OFF')
-        self.write('smub.source.output = smub.OUTPUT_OFF')
\ No newline at end of file
+        _forget_setpoints(self)
+        # One message; the printed 1 confirms that all statements have run
+        self.ask('reset() smua.source.output = smua.OUTPUT_OFF '
+                 'smub.source.output = smub.OUTPUT_OFF print(1)')
\ No newline at end of file
@@ -5,10 +5,75 @@ QCoDeS driver for the Lakeshore 372 AC resistance bridge
 used for temperature measurement and control in dilution refrigerators.
 """
 
+import asyncio
+import math
 import time
-from typing import Union, Dict
+from collections import deque
+from functools import partial
+from typing import Union, Dict, Iterable, List, Tuple
 from qcodes import VisaInstrument, validators as vals
 from qcodes.parameters import Parameter
+from pyvisa.errors import VisaIOError
+
+
+# Longest command string the instrument accepts; chained queries are
+# split into messages that fit
+_MAX_COMMAND_LENGTH = 64
+
+# Default age in seconds up to which get_all_temperatures() reuses a reading
+_DEFAULT_TEMPERATURE_TTL = 10.0
+
+# Channels whose query fails this many times in a row are skipped for
+# _FAILURE_COOLDOWN seconds by the all-channel readouts
+_FAILURE_LIMIT = 3
+_FAILURE_COOLDOWN = 60.0
+
+# Default age in seconds up to which setpoint, heater range and PID
+# read-backs are served from cache
+_SETTINGS_TTL = 60.0
+
+
+class _TemperatureApproach:
+    """
+    Poll interval and stall detection while waiting for a temperature.
+    
+    The next check is scheduled at half the expected time to reach the
+    tolerance band, so polling is slow far from the target and fast close
+    to it. The approach rate starts at the loop's ramp rate and follows the
+    observed rate once two readings are available.
+    """
+    
+    def __init__(self, tolerance: float, ramp_rate: float, min_interval: float,
+                 max_interval: float, stall_samples: int):
+        if stall_samples < 2:
+            raise ValueError(f"stall_samples must be at least 2, got {stall_samples}")
+        self.tolerance = tolerance
+        self.rate = ramp_rate  # K/s, 0 if unknown
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._history = deque(maxlen=stall_samples)  # (time, distance)
+        self.stall_reported = False
+        
+    def update(self, distance: float, now: float) -> float:
+        """
+        Record the distance to the target and return the next poll interval.
+        """
+        if self._history:
+            last_time, last_distance = self._history[-1]
+            if now > last_time:
+                self.rate = max(0.0, (last_distance - distance) / (now - last_time))
+        self._history.append((now, distance))
+        
+        if self.rate <= 0:
+            return self.max_interval
+        interval = 0.5 * (distance - self.tolerance) / self.rate
+        return max(self.min_interval, min(self.max_interval, interval))
+        
+    @property
+    def stalled(self) -> bool:
+        """True if the distance has not decreased over the last samples."""
+        history = self._history
+        return len(history) == history.maxlen and history[-1][1] >= history[0][1]
 
 
 class Lakeshore372(VisaInstrument):
@@ -19,38 +84,55 @@ class Lakeshore372(VisaInstrument):
     systems with multiple measurement channels.
     """
     
-    def __init__(self, name: str, address: str, **kwargs):
+    # Commonly used temperature channels with descriptive names
+    _NAMED_CHANNELS = {
+        'mixing_chamber_temp': 1,
+        'still_temp': 2,
+        'cold_plate_temp': 3,
+        'magnet_temp': 4,
+    }
+    
+    def __init__(self, name: str, address: str, lazy_connect: bool = False,
+                 **kwargs):
         """
         Initialize Lakeshore 372 temperature controller.
         
         Args:
             name: Name of the instrument
             address: VISA resource address
+            lazy_connect: Skip the identification query on connect
         """
         super().__init__(name, address, terminator='\r\n', **kwargs)
         
-        # Temperature reading channels (1-16 available)
-        for i in range(1, 17):
-            self.add_parameter(
-                f'temperature_{i:02d}',
-                get_cmd=f'KRDG? {i}',
-                unit='K',
-                docstring=f'Temperature reading from channel {i}'
-            )
-            
-            self.add_parameter(
-                f'resistance_{i:02d}',
-                get_cmd=f'SRDG? {i}',
-                unit='Ohm',
-                docstring=f'Resistance reading from channel {i}'
+        # Replies of rarely changing settings: query -> (reply, monotonic time).
+        # Entries are dropped when the setting is written.
+        self._settings_cache: Dict[str, Tuple[str, float]] = {}
+        self.settings_ttl = _SETTINGS_TTL
+        # Loops with a ramp running; their setpoint changes on its own
+        self._ramping_loops = set()
+        
+        # Temperature and resistance reading channels (1-16 available):
+        # (name, get_cmd, unit, docstring)
+        channel_specs = [
+            spec
+            for i in range(1, 17)
+            for spec in (
+                (f'temperature_{i:02d}', f'KRDG? {i}', 'K',
+                 f'Temperature reading from channel {i}'),
+                (f'resistance_{i:02d}', f'SRDG? {i}', 'Ohm',
+                 f'Resistance reading from channel {i}'),
             )
+        ]
+        for param_name, get_cmd, unit, docstring in channel_specs:
+            self.add_parameter(param_name, get_cmd=get_cmd, unit=unit,
+                               docstring=docstring)
         
         # Control loop parameters (2 control outputs available)
         for i in range(1, 3):
             self.add_parameter(
                 f'setpoint_{i}',
-                get_cmd=f'SETP? {i}',
-                set_cmd=f'SETP {i},{{:.6f}}',
+                get_cmd=partial(self._get_setpoint, i),
+                set_cmd=partial(self._write_setting, f'SETP? {i}', f'SETP {i},{{:.6f}}'),
                 unit='K',
                 vals=vals.Numbers(0, 400),
                 docstring=f'Temperature setpoint for control loop {i}'
@@ -65,8 +147,8 @@ class Lakeshore372(VisaInstrument):
             
             self.add_parameter(
                 f'heater_range_{i}',
-                get_cmd=f'RANGE? {i}',
-                set_cmd=f'RANGE {i},{{}}',
+                get_cmd=partial(self._cached_ask, f'RANGE? {i}'),
+                set_cmd=partial(self._write_setting, f'RANGE? {i}', f'RANGE {i},{{}}'),
                 vals=vals.Enum(0, 1, 2, 3, 4, 5),
                 docstring=f'Heater range setting for loop {i}'
             )
@@ -74,46 +156,34 @@ class Lakeshore372(VisaInstrument):
         # PID parameters for control loop 1
         self.add_parameter(
             'pid_p1',
-            get_cmd='PID? 1',
+            get_cmd=partial(self._cached_ask, 'PID? 1'),
             set_cmd=self._set_pid_1,
             docstring='PID parameters for control loop 1 (P, I, D)'
         )
         
         self.add_parameter(
             'pid_p2', 
-            get_cmd='PID? 2',
+            get_cmd=partial(self._cached_ask, 'PID? 2'),
             set_cmd=self._set_pid_2,
             docstring='PID parameters for control loop 2 (P, I, D)'
         )
         
-        # Commonly used temperature channels with descriptive names
-        self.add_parameter(
-            'mixing_chamber_temp',
-            get_cmd='KRDG? 1',  # Typically channel 1
-            unit='K',
-            docstring='Mixing chamber temperature'
-        )
+        # Temperature cache for get_all_temperatures():
+        # channel -> (temperature, monotonic time of the reading)
+        self._temp_cache: Dict[int, Tuple[float, float]] = {}
+        self._temperature_ttl = {i: _DEFAULT_TEMPERATURE_TTL for i in range(1, 17)}
+        # The mixing chamber changes fastest during ramps
+        self._temperature_ttl[self._NAMED_CHANNELS['mixing_chamber_temp']] = 1.0
         
-        self.add_parameter(
-            'still_temp',
-            get_cmd='KRDG? 2',  # Typically channel 2
-            unit='K', 
-            docstring='Still temperature'
-        )
+        # Errors of the last all-channel readout by channel, and consecutive
+        # VISA failures / skip deadlines used to demote unresponsive channels
+        self._last_channel_errors: Dict[int, Exception] = {}
+        self._channel_failures: Dict[int, int] = {}
+        self._channel_skip_until: Dict[int, float] = {}
         
-        self.add_parameter(
-            'cold_plate_temp',
-            get_cmd='KRDG? 3',  # Typically channel 3
-            unit='K',
-            docstring='Cold plate temperature' 
-        )
-        
-        self.add_parameter(
-            'magnet_temp',
-            get_cmd='KRDG? 4',  # Typically channel 4
-            unit='K',
-            docstring='Magnet temperature'
-        )
+        # Descriptive aliases (same parameter objects as temperature_01..04)
+        for alias, channel in self._NAMED_CHANNELS.items():
+            self.parameters[alias] = self.parameters[f'temperature_{channel:02d}']
         
         # Scanner configuration
         self.add_parameter(
@@ -133,47 +203,194 @@ class Lakeshore372(VisaInstrument):
             docstring='Scanner dwell time per channel'
         )
         
-        self.connect_message()
+        if not lazy_connect:
+            self.connect_message()
+        
+    def _cached_ask(self, query: str) -> str:
+        """
+        Query a rarely changing setting.
+        
+        The reply is reused for settings_ttl seconds, or until the setting
+        is written through this driver.
+        """
+        now = time.monotonic()
+        cached = self._settings_cache.get(query)
+        if cached is not None and now - cached[1] < self.settings_ttl:
+            return cached[0]
+        reply = self.ask(query)
+        self._settings_cache[query] = (reply, now)
+        return reply
+        
+    def _write_setting(self, query: str, cmd: str, value=None) -> None:
+        """
+        Write a setting and drop the cached reply of its query.
+        
+        Args:
+            query: Query reading the setting back, e.g. 'RANGE? 1'
+            cmd: Command, formatted with ``value`` if given
+            value: Value to set
+        """
+        self.write(cmd if value is None else cmd.format(value))
+        self._settings_cache.pop(query, None)
+        
+    def _get_setpoint(self, loop: int) -> str:
+        """Get the setpoint of a control loop; not cached while ramping."""
+        if loop in self._ramping_loops:
+            return self.ask(f'SETP? {loop}')
+        return self._cached_ask(f'SETP? {loop}')
         
     def _set_pid_1(self, pid_values: str) -> None:
         """Set PID parameters for control loop 1."""
-        self.write(f'PID 1,{pid_values}')
+        self._write_setting('PID? 1', f'PID 1,{pid_values}')
         
     def _set_pid_2(self, pid_values: str) -> None:
         """Set PID parameters for control loop 2."""
-        self.write(f'PID 2,{pid_values}')
+        self._write_setting('PID? 2', f'PID 2,{pid_values}')
         
-    def get_all_temperatures(self) -> Dict[int, float]:
+    def _query_all_channels(self, query: str, channels: Iterable[int] = range(1, 17),
+                            strict: bool = False) -> Dict[int, float]:
+        """
+        Send ``query`` for several channels using chained queries.
+        
+        Queries are joined with ';' into as few messages as the command
+        length limit allows (3 instead of 16 round-trips). Unless strict,
+        readings that cannot be parsed, or whose message fails, are returned
+        as NaN and their error is kept in channel_errors. Channels whose
+        message failed _FAILURE_LIMIT times in a row are not queried for
+        _FAILURE_COOLDOWN seconds.
+        
+        Args:
+            query: Reading query without channel, e.g. 'KRDG?'
+            channels: Channels to read (default: all 16)
+            strict: Raise the first error instead of returning NaN;
+                    channels in cool-down are queried as well
+            
+        Raises:
+            ValueError: Invalid or missing reading (strict only)
+            VisaIOError: Failed query (strict only)
+        """
+        now = time.monotonic()
+        readings = {}
+        groups = [[]]
+        length = 0
+        for i in channels:
+            if not strict and self._channel_skip_until.get(i, 0) > now:
+                readings[i] = float('nan')  # Keeps its last error
+                continue
+            cmd_len = len(query) + len(str(i)) + 2  # ' ' and ';' separators
+            if groups[-1] and length + cmd_len > _MAX_COMMAND_LENGTH:
+                groups.append([])
+                length = 0
+            groups[-1].append(i)
+            length += cmd_len
+            
+        for group in groups:
+            if not group:
+                continue
+            try:
+                replies = self.ask(';'.join(f'{query} {i}' for i in group)).split(';')
+            except VisaIOError as e:
+                if strict:
+                    raise
+                for i in group:
+                    readings[i] = float('nan')
+                    self._last_channel_errors[i] = e
+                    self._channel_failures[i] = self._channel_failures.get(i, 0) + 1
+                    if self._channel_failures[i] >= _FAILURE_LIMIT:
+                        self._channel_skip_until[i] = now + _FAILURE_COOLDOWN
+                        self._channel_failures[i] = 0
+                continue
+                
+            for n, i in enumerate(group):
+                self._channel_failures.pop(i, None)
+                self._channel_skip_until.pop(i, None)
+                try:
+                    readings[i] = float(replies[n])
+                except (ValueError, IndexError) as e:
+                    if strict:
+                        raise ValueError(f"Invalid {query} reading for channel {i}") from e
+                    readings[i] = float('nan')
+                    self._last_channel_errors[i] = e
+                else:
+                    self._last_channel_errors.pop(i, None)
+        return readings
+        
+    @property
+    def channel_errors(self) -> Dict[int, Exception]:
+        """Errors of channels whose last all-channel reading failed."""
+        return dict(self._last_channel_errors)
+        
+    def get_all_temperatures(self, strict: bool = False) -> Dict[int, float]:
         """
         Get temperature readings from all 16 channels.
         
+        Readings younger than the channel's TTL (see set_temperature_ttl())
+        are returned from cache; only the stale channels are queried.
+        Failed readings are NaN (see channel_errors).
+        
+        Args:
+            strict: Raise on the first failed reading instead
+            
         Returns:
             Dictionary mapping channel numbers to temperatures in K
         """
-        temperatures = {}
-        for i in range(1, 17):
-            try:
-                temp = float(self.ask(f'KRDG? {i}'))
-                temperatures[i] = temp
-            except (ValueError, Exception):
-                temperatures[i] = float('nan')
-        return temperatures
+        now = time.monotonic()
+        stale = [i for i in range(1, 17)
+                 if i not in self._temp_cache
+                 or now - self._temp_cache[i][1] >= self._temperature_ttl[i]]
+        
+        if stale:
+            for i, temperature in self._query_all_channels('KRDG?', stale, strict).items():
+                if math.isnan(temperature):  # Failed readings are not cached
+                    self._temp_cache.pop(i, None)
+                else:
+                    self._temp_cache[i] = (temperature, now)
+                    
+        return {i: self._temp_cache[i][0] if i in self._temp_cache else float('nan')
+                for i in range(1, 17)}
+        
+    async def get_all_temperatures_async(self) -> Dict[int, float]:
+        """
+        Get temperature readings from all 16 channels without blocking
+        the event loop.
+        
+        The readout runs in the default executor, so readouts of several
+        controllers overlap (see read_all_temperatures()).
+        
+        Returns:
+            Dictionary mapping channel numbers to temperatures in K
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_all_temperatures)
         
-    def get_all_resistances(self) -> Dict[int, float]:
+    def set_temperature_ttl(self, seconds: float, channel: int = None) -> None:
+        """
+        Set how long get_all_temperatures() reuses a reading.
+        
+        Args:
+            seconds: Maximum age of a cached reading (0 disables caching)
+            channel: Channel to set (default: all channels)
+        """
+        if seconds < 0:
+            raise ValueError(f"TTL must be non-negative, got {seconds}")
+        if channel is not None and channel not in self._temperature_ttl:
+            raise ValueError(f"Channel must be 1-16, got {channel}")
+        for i in ([channel] if channel is not None else range(1, 17)):
+            self._temperature_ttl[i] = seconds
+        
+    def get_all_resistances(self, strict: bool = False) -> Dict[int, float]:
         """
         Get resistance readings from all 16 channels.
         
+        Failed readings are NaN (see channel_errors).
+        
+        Args:
+            strict: Raise on the first failed reading instead
+            
         Returns:
             Dictionary mapping channel numbers to resistances in Ohms
         """
-        resistances = {}
-        for i in range(1, 17):
-            try:
-                res = float(self.ask(f'SRDG? {i}'))
-                resistances[i] = res
-            except (ValueError, Exception):
-                resistances[i] = float('nan')
-        return resistances
+        return self._query_all_channels('SRDG?', strict=strict)
         
     def configure_control_loop(self, loop: int, input_channel: int, 
                               units: str = 'K', powerup_enable: bool = True,
@@ -192,7 +409,7 @@ class Lakeshore372(VisaInstrument):
         self.write(f'CSET {loop},{input_channel},{units},{enable}')
         
         if setpoint is not None:
-            self.write(f'SETP {loop},{setpoint:.6f}')
+            self._write_setting(f'SETP? {loop}', f'SETP {loop},{setpoint:.6f}')
             
     def set_heater_range(self, loop: int, range_setting: int) -> None:
         """
@@ -202,7 +419,7 @@ class Lakeshore372(VisaInstrument):
             loop: Control loop number (1 or 2)  
             range_setting: Range setting (0=Off, 1-5 for different power ranges)
         """
-        self.write(f'RANGE {loop},{range_setting}')
+        self._write_setting(f'RANGE? {loop}', f'RANGE {loop},{range_setting}')
         
     def set_pid_parameters(self, loop: int, p: float, i: float, d: float) -> None:
         """
@@ -214,7 +431,7 @@ class Lakeshore372(VisaInstrument):
             i: Integral gain  
             d: Derivative gain
         """
-        self.write(f'PID {loop},{p:.3f},{i:.3f},{d:.3f}')
+        self._write_setting(f'PID? {loop}', f'PID {loop},{p:.3f},{i:.3f},{d:.3f}')
         
     def ramp_temperature(self, loop: int, setpoint: float, 
                         ramp_rate: float, units: str = 'K') -> None:
@@ -229,8 +446,9 @@ class Lakeshore372(VisaInstrument):
         """
         # Enable ramping
         self.write(f'RAMP {loop},1,{ramp_rate:.3f}')
+        self._ramping_loops.add(loop)
         # Set new setpoint
-        self.write(f'SETP {loop},{setpoint:.6f}')
+        self._write_setting(f'SETP? {loop}', f'SETP {loop},{setpoint:.6f}')
         
     def stop_ramp(self, loop: int) -> None:
         """
@@ -240,36 +458,119 @@ class Lakeshore372(VisaInstrument):
             loop: Control loop number (1 or 2)
         """
         self.write(f'RAMP {loop},0')
+        self._ramping_loops.discard(loop)
+        self._settings_cache.pop(f'SETP? {loop}', None)
+        
+    def _ramp_rate(self, loop: int) -> float:
+        """
+        Get the ramp rate of a control loop.
+        
+        Returns:
+            Ramp rate in K/s, or 0 if ramping is off
+        """
+        enabled, rate = self.ask(f'RAMP? {loop}').split(',')[:2]
+        return float(rate) / 60 if int(enabled) else 0.0
+        
+    def _approach(self, loop: int, tolerance: float, check_interval: float,
+                  min_check_interval: float, stall_samples: int) -> _TemperatureApproach:
+        """Start approach tracking for wait_for_temperature()."""
+        return _TemperatureApproach(tolerance, self._ramp_rate(loop), min_check_interval,
+                                    check_interval, stall_samples)
+        
+    def _check_stall(self, approach: _TemperatureApproach, target: float,
+                     abort_on_stall: bool) -> bool:
+        """Log a stalled approach once; return True if waiting should stop."""
+        if not approach.stalled:
+            return False
+        if not approach.stall_reported:
+            approach.stall_reported = True
+            self.log.warning(f"Temperature approach to {target} K has stalled")
+        return abort_on_stall
         
     def wait_for_temperature(self, loop: int, target: float, 
                            tolerance: float = 0.01, timeout: float = 3600,
-                           check_interval: float = 10) -> bool:
+                           check_interval: float = 10,
+                           min_check_interval: float = 0.5,
+                           stall_samples: int = 10,
+                           abort_on_stall: bool = False) -> bool:
         """
         Wait for temperature to reach target within tolerance.
         
+        Polling adapts to the distance from the target: the next check is
+        at half the expected time to reach it, between min_check_interval
+        and check_interval.
+        
         Args:
             loop: Control loop number (1 or 2)
             target: Target temperature in K
             tolerance: Temperature tolerance in K
             timeout: Maximum wait time in seconds
-            check_interval: Time between temperature checks in seconds
+            check_interval: Longest time between temperature checks in seconds
+            min_check_interval: Shortest time between temperature checks in seconds
+            stall_samples: Number of checks without progress after which
+                           the approach is reported as stalled (at least 2)
+            abort_on_stall: Return False as soon as the approach stalls
             
         Returns:
-            True if temperature reached target, False if timeout
+            True if temperature reached target, False if timeout (or stall)
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
         # Get the input channel for this loop
         cset_response = self.ask(f'CSET? {loop}')
         input_channel = int(cset_response.split(',')[0])
+        approach = self._approach(loop, tolerance, check_interval,
+                                  min_check_interval, stall_samples)
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             current_temp = float(self.ask(f'KRDG? {input_channel}'))
+            distance = abs(current_temp - target)
+            
+            if distance <= tolerance:
+                return True
+                
+            interval = approach.update(distance, time.monotonic())
+            if self._check_stall(approach, target, abort_on_stall):
+                return False
+            time.sleep(interval)
+            
+        return False
+        
+    async def wait_for_temperature_async(self, loop: int, target: float,
+                                         tolerance: float = 0.01, timeout: float = 3600,
+                                         check_interval: float = 10,
+                                         min_check_interval: float = 0.5,
+                                         stall_samples: int = 10,
+                                         abort_on_stall: bool = False) -> bool:
+        """
+        Wait for temperature to reach target without blocking the event loop.
+        
+        Queries run in the default executor, so other instruments can be
+        serviced from the same event loop while the temperature settles.
+        Arguments and return value are as for wait_for_temperature().
+        """
+        event_loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        
+        # Get the input channel for this loop
+        cset_response = await event_loop.run_in_executor(None, self.ask, f'CSET? {loop}')
+        input_channel = int(cset_response.split(',')[0])
+        approach = await event_loop.run_in_executor(
+            None, self._approach, loop, tolerance, check_interval,
+            min_check_interval, stall_samples)
+        
+        while time.monotonic() < deadline:
+            current_temp = float(await event_loop.run_in_executor(
+                None, self.ask, f'KRDG? {input_channel}'))
+            distance = abs(current_temp - target)
             
-            if abs(current_temp - target) <= tolerance:
+            if distance <= tolerance:
                 return True
                 
-            time.sleep(check_interval)
+            interval = approach.update(distance, time.monotonic())
+            if self._check_stall(approach, target, abort_on_stall):
+                return False
+            await asyncio.sleep(interval)
             
         return False
         
@@ -317,4 +618,18 @@ class Lakeshore372(VisaInstrument):
             'model': parts[1] if len(parts) > 1 else '',
             'serial': parts[2] if len(parts) > 2 else '',
             'firmware': parts[3] if len(parts) > 3 else ''
-        }
\ No newline at end of file
+        }
+
+
+async def read_all_temperatures(instruments: Iterable[Lakeshore372]) -> List[Dict[int, float]]:
+    """
+    Read all channels of several temperature controllers concurrently.
+    
+    Args:
+        instruments: Temperature controllers to read
+        
+    Returns:
+        One dictionary of channel temperatures per instrument, in order
+    """
+    return list(await asyncio.gather(
+        *(inst.get_all_temperatures_async() for inst in instruments)))
@@ -5,8 +5,10 @@ QCoDeS driver for the Zurich Instruments MFLI lock-in amplifier
 used for AC transport measurements and harmonic analysis.
 """
 
+import asyncio
+import math
 import numpy as np
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional, Tuple
 from qcodes import Instrument, validators as vals
 from qcodes.parameters import Parameter
 import time
@@ -20,6 +22,9 @@ class ZurichMFLI(Instrument):
     capabilities for transport measurements.
     """
     
+    # Demodulator used for each harmonic (1 = fundamental)
+    _HARMONIC_DEMODS = {1: 0, 2: 1, 3: 2}
+    
     def __init__(self, name: str, device_id: str = None, **kwargs):
         """
         Initialize MFLI lock-in amplifier.
@@ -37,6 +42,10 @@ class ZurichMFLI(Instrument):
         # For now, create placeholder for the connection
         self._daq = None  # Placeholder for actual DAQ module
         
+        # Latest X/Y of all demodulators, read together by _refresh_samples()
+        self._samples: Dict[int, Tuple[float, float]] = {}
+        self._samples_time = float('-inf')
+        
         # AC voltage measurement parameters
         self.add_parameter(
             'amplitude_x',
@@ -129,15 +138,39 @@ class ZurichMFLI(Instrument):
         
         self.connect_message()
         
+    def _refresh_samples(self) -> Dict[int, Tuple[float, float]]:
+        """
+        Read X and Y of all demodulators as one snapshot.
+        
+        Returns:
+            Dictionary mapping demodulator index to (X, Y)
+        """
+        # Placeholder - would use actual Zurich API (one getSample of
+        # /{device_id}/demods/{n}/sample per demodulator)
+        self._samples = {demod: (0.0, 0.0) for demod in self._HARMONIC_DEMODS.values()}
+        self._samples_time = time.monotonic()
+        return self._samples
+        
+    def _get_samples(self) -> Dict[int, Tuple[float, float]]:
+        """
+        Get the demodulator snapshot, refreshing it when it is too old.
+        
+        The lock-in output cannot change much faster than the time
+        constant, so a snapshot is reused for a fifth of it. Separate
+        X, Y and harmonic reads then cost one API call instead of one each.
+        """
+        max_age = self.time_constant.cache.get() / 5
+        if time.monotonic() - self._samples_time >= max_age:
+            return self._refresh_samples()
+        return self._samples
+        
     def _get_amplitude_x(self) -> float:
         """Get X amplitude from demodulator."""
-        # Placeholder - would use actual Zurich API
-        return 0.0
+        return self._get_samples()[self._HARMONIC_DEMODS[1]][0]
         
     def _get_amplitude_y(self) -> float:
         """Get Y amplitude from demodulator."""
-        # Placeholder - would use actual Zurich API
-        return 0.0
+        return self._get_samples()[self._HARMONIC_DEMODS[1]][1]
         
     def _get_phase(self) -> float:
         """Get phase from demodulator."""
@@ -200,8 +233,53 @@ class ZurichMFLI(Instrument):
         Returns:
             Harmonic amplitude
         """
-        # Placeholder - would use actual Zurich API with multiple demodulators
-        return 0.0
+        sample = self._get_samples()[self._HARMONIC_DEMODS[harmonic]]
+        return sample[0] if component == 'x' else sample[1]
+        
+    def read_harmonics(self) -> Dict[int, Tuple[float, float]]:
+        """
+        Read X and Y of the fundamental and all harmonics at once.
+        
+        All values come from one fresh demodulator snapshot, so this costs
+        one API call instead of one per harmonic_*/amplitude_* parameter.
+        
+        Returns:
+            Dictionary mapping harmonic number (1 = fundamental) to (X, Y)
+        """
+        samples = self._refresh_samples()
+        return {harmonic: samples[demod] for harmonic, demod in self._HARMONIC_DEMODS.items()}
+        
+    def read_samples(self, count: int, interval: Optional[float] = None) -> np.ndarray:
+        """
+        Read a burst of demodulator samples in one transfer.
+        
+        Replaces ``count`` separate reads when averaging: the samples are
+        averaged on the host by the caller. Samples closer together than
+        the time constant are correlated through the demodulator filter
+        and averaging them does not reduce the noise, so the burst is
+        spaced by at least one time constant (fully independent samples
+        need about five). A burst therefore takes ``count * interval``.
+        
+        Args:
+            count: Number of samples
+            interval: Sample spacing in s (default and minimum: the time constant)
+            
+        Returns:
+            Array of shape (count, harmonic, 2) with X and Y of the
+            fundamental, 2nd and 3rd harmonic
+        """
+        time_constant = self.time_constant.cache.get()
+        interval = time_constant if interval is None else max(interval, time_constant)
+        # Placeholder - would use actual Zurich API: set the demodulator
+        # rate to 1 / interval, then poll() the subscribed sample nodes for
+        # ``count`` samples in one transfer
+        samples = np.empty((count, len(self._HARMONIC_DEMODS), 2))
+        for i in range(count):
+            if i:
+                time.sleep(interval)
+            snapshot = self._refresh_samples()
+            samples[i] = [snapshot[demod] for demod in self._HARMONIC_DEMODS.values()]
+        return samples
         
     def get_amplitude_phase(self) -> tuple:
         """
@@ -211,11 +289,11 @@ class ZurichMFLI(Instrument):
             Tuple of (amplitude, phase) where amplitude is R = sqrt(X² + Y²)
             and phase is in degrees
         """
-        x = self.amplitude_x()
-        y = self.amplitude_y()
+        # X and Y from the same sample
+        x, y = self._refresh_samples()[self._HARMONIC_DEMODS[1]]
         
-        amplitude = np.sqrt(x**2 + y**2)
-        phase = np.degrees(np.arctan2(y, x))
+        amplitude = math.hypot(x, y)
+        phase = math.degrees(math.atan2(y, x))
         
         return amplitude, phase
         
@@ -230,7 +308,7 @@ class ZurichMFLI(Instrument):
             Resistance in Ohms
         """
         voltage_amplitude, _ = self.get_amplitude_phase()
-        return voltage_amplitude / current_amplitude if current_amplitude != 0 else np.inf
+        return voltage_amplitude / current_amplitude if current_amplitude != 0 else math.inf
         
     def configure_harmonic_measurement(self, harmonics: List[int] = [1, 2, 3]) -> None:
         """
@@ -243,6 +321,19 @@ class ZurichMFLI(Instrument):
         # for different harmonics in actual implementation
         pass
         
+    def settling_time(self, settling_factor: float = 5.0) -> float:
+        """
+        Get the time the lock-in output needs to settle after a step.
+        
+        Args:
+            settling_factor: Multiplier for time constant to determine settling time
+            
+        Returns:
+            Settling time in seconds
+        """
+        # Cached value, kept current by set; no instrument read
+        return self.time_constant.cache.get() * settling_factor
+        
     def wait_for_settling(self, settling_factor: float = 5.0) -> None:
         """
         Wait for lock-in to settle based on time constant.
@@ -250,30 +341,34 @@ class ZurichMFLI(Instrument):
         Args:
             settling_factor: Multiplier for time constant to determine settling time
         """
-        tc = self.time_constant()
-        settling_time = tc * settling_factor
-        time.sleep(settling_time)
+        time.sleep(self.settling_time(settling_factor))
+        
+    async def wait_for_settling_async(self, settling_factor: float = 5.0) -> None:
+        """
+        Wait for lock-in to settle without blocking the event loop.
+        
+        Args:
+            settling_factor: Multiplier for time constant to determine settling time
+        """
+        await asyncio.sleep(self.settling_time(settling_factor))
         
     def auto_phase(self) -> float:
         """
         Perform automatic phase adjustment to maximize X component.
         
+        Since X = R cos(theta) and Y = R sin(theta), the signal phase
+        relative to the current reference is atan2(Y, X); adding it to the
+        current phase puts the whole signal into X. This needs one reading
+        instead of a sweep over all phases.
+        
         Returns:
             Optimized phase in degrees
         """
-        # Simple auto-phase implementation
-        # In practice, would use built-in auto-phase functionality
-        best_phase = 0
-        best_x = 0
-        
-        for phase in np.linspace(-180, 180, 361):
-            self.phase(phase)
-            time.sleep(0.1)  # Brief settling
-            x = self.amplitude_x()
-            if abs(x) > abs(best_x):
-                best_x = x
-                best_phase = phase
-                
+        x, y = self._refresh_samples()[self._HARMONIC_DEMODS[1]]
+        best_phase = self.phase() + math.degrees(math.atan2(y, x))
+        # Wrap into the phase parameter's range [-180, 180)
+        best_phase = float((best_phase + 180) % 360 - 180)
+        
         self.phase(best_phase)
         return best_phase
         
@@ -290,29 +385,29 @@ class ZurichMFLI(Instrument):
             Dictionary with averaged X, Y, R, and phase values
         """
         if delay is None:
-            delay = 2 * self.time_constant()
+            delay = 2 * self.time_constant.cache.get()
             
-        x_values = []
-        y_values = []
+        x_values = np.empty(averages)
+        y_values = np.empty(averages)
         
-        for _ in range(averages):
-            x_values.append(self.amplitude_x())
-            y_values.append(self.amplitude_y())
+        for i in range(averages):
+            # X and Y from the same sample
+            x_values[i], y_values[i] = self._refresh_samples()[self._HARMONIC_DEMODS[1]]
             if averages > 1:
                 time.sleep(delay)
                 
-        x_avg = np.mean(x_values)
-        y_avg = np.mean(y_values)
-        r_avg = np.sqrt(x_avg**2 + y_avg**2)
-        phase_avg = np.degrees(np.arctan2(y_avg, x_avg))
+        x_avg = x_values.mean()
+        y_avg = y_values.mean()
+        r_avg = math.hypot(x_avg, y_avg)
+        phase_avg = math.degrees(math.atan2(y_avg, x_avg))
         
         return {
             'x': x_avg,
             'y': y_avg, 
             'r': r_avg,
             'phase': phase_avg,
-            'x_std': np.std(x_values),
-            'y_std': np.std(y_values)
+            'x_std': x_values.std(),
+            'y_std': y_values.std()
         }
         
     def get_idn(self) -> dict:
@@ -9,13 +9,93 @@ Implements differential conductance (dI-dV) measurement protocols equivalent to
 
 import numpy as np
 import time
-from typing import List, Dict, Union, Optional, Tuple
+from functools import lru_cache, partial
+from typing import Callable, List, Dict, Union, Optional, Tuple
 from dataclasses import dataclass
 from qcodes import Measurement
 
 from .station_setup import BlueforsStation
 
 
+# Longest time between database commits of a sweep, so live plots keep updating
+_MAX_WRITE_PERIOD = 60.0
+
+
+@lru_cache(maxsize=16)
+def _make_sweep(start: float, stop: float, num_points: int,
+                bidirectional: bool) -> np.ndarray:
+    """
+    Build the bias voltage points of a sweep.
+    
+    The points are written into one contiguous array (forward, then
+    reversed if bidirectional) without intermediate copies. The result is
+    cached and shared, so it is read-only.
+    """
+    forward = np.linspace(start, stop, num_points)
+    if not bidirectional:
+        points = forward
+    else:
+        points = np.empty(2 * num_points)
+        points[:num_points] = forward
+        points[num_points:] = forward[::-1]
+    points.flags.writeable = False
+    return points
+
+
+def _divide(numerator, denominator, fill: float) -> np.ndarray:
+    """
+    Divide element-wise, using ``fill`` where the denominator is zero.
+    
+    Args:
+        numerator: Array or scalar
+        denominator: Array or scalar
+        fill: Result where the denominator is zero
+        
+    Returns:
+        Array of quotients
+    """
+    numerator, denominator = np.broadcast_arrays(np.asarray(numerator, dtype=np.float64),
+                                                 np.asarray(denominator, dtype=np.float64))
+    out = np.full(numerator.shape, fill)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+
+def _wait_for_settling(lockin, delay: float) -> None:
+    """
+    Wait after a bias step for the DC delay and the lock-in to settle.
+    
+    Both settling processes start at the bias step and run concurrently,
+    so the wait is the longer of the two rather than their sum.
+    
+    Args:
+        lockin: Lock-in amplifier
+        delay: DC settling delay in seconds
+    """
+    time.sleep(max(delay, lockin.settling_time()))
+
+
+def _set_write_period(meas: Measurement, params: 'DifferentialParameters',
+                      lockin) -> None:
+    """
+    Commit the results of a sweep to the database about ten times.
+    
+    DataSaver.add_result() only buffers results; they are committed every
+    write_period and when the run exits. Scaling the period with the
+    expected sweep duration bounds the number of commits per sweep.
+    
+    Args:
+        meas: Measurement to configure
+        params: Sweep parameters
+        lockin: Lock-in amplifier (for its settling time)
+    """
+    # DC averages, then the lock-in burst spaced by the time constant
+    point_time = (max(params.delay_between_points, lockin.settling_time())
+                  + params.averages * params.inter_average_delay
+                  + (params.averages - 1) * lockin.time_constant.cache.get())
+    duration = len(params.voltage_points) * point_time
+    meas.write_period = min(_MAX_WRITE_PERIOD, max(meas.write_period, duration / 10))
+
+
 @dataclass
 class DifferentialParameters:
     """Parameters for differential conductance measurements."""
@@ -28,6 +108,15 @@ class DifferentialParameters:
     averages: int = 5           # Number of averages per point
     delay_between_points: float = 0.1
     bidirectional: bool = True
+    # Delay between DC averages in s. Lock-in samples need none: the
+    # burst read by read_samples() is spaced by the time constant.
+    inter_average_delay: float = 0.0
+    
+    @property
+    def voltage_points(self) -> np.ndarray:
+        """Bias voltage points of the sweep (read-only)."""
+        return _make_sweep(self.start_voltage, self.stop_voltage,
+                           self.num_points, self.bidirectional)
 
 
 class DifferentialConductance:
@@ -58,24 +147,25 @@ class DifferentialConductance:
         station.setup_differential_measurement()
         
     def run_sweep(self, params: DifferentialParameters,
-                  dataset_name: str = "differential_conductance") -> Dict[str, np.ndarray]:
+                  dataset_name: str = "differential_conductance",
+                  on_complete: Optional[Callable[[], None]] = None) -> Dict[str, np.ndarray]:
         """
         Run differential conductance sweep.
         
         Args:
             params: Measurement parameters
             dataset_name: Dataset name
+            on_complete: Called after the last point with the bias at zero
+                         and the output off, before the results are
+                         committed, so that work it starts overlaps the
+                         final database write
             
         Returns:
             Dictionary with measurement data
         """
         # Generate voltage points
-        voltage_points = np.linspace(params.start_voltage, params.stop_voltage, params.num_points)
+        voltage_points = params.voltage_points
         
-        if params.bidirectional:
-            reverse_points = voltage_points[::-1]
-            voltage_points = np.concatenate([voltage_points, reverse_points])
-            
         # Configure lock-in
         self.lockin.frequency(params.frequency)
         self.lockin.amplitude(params.ac_amplitude)
@@ -85,6 +175,9 @@ class DifferentialConductance:
         dc_voltage_param = getattr(self.smu, f'voltage_{self.smu_channel}')
         dc_current_param = getattr(self.smu, f'current_{self.smu_channel}')
         output_param = getattr(self.smu, f'output_{self.smu_channel}')
+        ac_x_param = self.lockin.amplitude_x
+        ac_y_param = self.lockin.amplitude_y
+        read_samples = self.lockin.read_samples
         
         self.smu.configure_voltage_source(self.smu_channel)
         self.smu.set_compliance(self.smu_channel, current_limit=1e-6)
@@ -93,97 +186,95 @@ class DifferentialConductance:
         meas = Measurement()
         meas.register_parameter(dc_voltage_param)
         meas.register_parameter(dc_current_param, setpoints=(dc_voltage_param,))
-        meas.register_parameter(self.lockin.amplitude_x, setpoints=(dc_voltage_param,))
-        meas.register_parameter(self.lockin.amplitude_y, setpoints=(dc_voltage_param,))
+        meas.register_parameter(ac_x_param, setpoints=(dc_voltage_param,))
+        meas.register_parameter(ac_y_param, setpoints=(dc_voltage_param,))
+        _set_write_period(meas, params, self.lockin)
         
+        # Measured values; derived quantities are calculated after the sweep
         results = {
-            'voltage': [],
-            'current': [],
-            'resistance': [],
-            'diff_voltage_x': [],
-            'diff_voltage_y': [],
-            'diff_voltage_r': [],
-            'diff_voltage_phase': [],
-            'diff_conductance': [],
-            'diff_resistance': []
+            key: np.empty(len(voltage_points), dtype=np.float64)
+            for key in ('current', 'diff_voltage_x', 'diff_voltage_y',
+                        'diff_voltage_r', 'diff_voltage_phase')
         }
         
-        # Enable outputs
-        output_param(True)
-        
-        try:
-            with meas.run() as datasaver:
-                for voltage in voltage_points:
+        with meas.run() as datasaver:
+            # Enable outputs
+            output_param(True)
+            
+            try:
+                for n, voltage in enumerate(voltage_points):
                     # Set DC bias voltage
                     dc_voltage_param(voltage)
                     
                     # Wait for settling
-                    time.sleep(params.delay_between_points)
-                    self.lockin.wait_for_settling()
+                    _wait_for_settling(self.lockin, params.delay_between_points)
                     
                     # Take averaged measurements
                     dc_current_avg = 0
-                    ac_measurements = {
-                        'x': [],
-                        'y': [],
-                        'r': [],
-                        'phase': []
-                    }
                     
                     for _ in range(params.averages):
                         # DC measurements
                         dc_current_avg += dc_current_param()
                         
-                        # AC measurements
-                        ac_data = self.lockin.measure_with_averaging(1)
-                        ac_measurements['x'].append(ac_data['x'])
-                        ac_measurements['y'].append(ac_data['y'])
-                        ac_measurements['r'].append(ac_data['r'])
-                        ac_measurements['phase'].append(ac_data['phase'])
-                        
-                        time.sleep(0.05)  # Brief delay between averages
+                        if params.inter_average_delay:
+                            time.sleep(params.inter_average_delay)
                         
+                    # AC measurements: one burst of fundamental X/Y samples
+                    ac_x, ac_y = read_samples(params.averages)[:, 0].T
+                    
                     # Calculate averages
                     dc_current_avg /= params.averages
-                    ac_x_avg = np.mean(ac_measurements['x'])
-                    ac_y_avg = np.mean(ac_measurements['y'])
-                    ac_r_avg = np.mean(ac_measurements['r'])
-                    ac_phase_avg = np.mean(ac_measurements['phase'])
-                    
-                    # Calculate differential conductance (dI/dV)
-                    # The lock-in measures dV, we want dI/dV = (dV/R)/dV = 1/R * (dI_ac/dV_ac)
-                    # For small signal: dI/dV ≈ I_ac / V_ac
-                    diff_conductance = params.ac_amplitude / ac_r_avg if ac_r_avg != 0 else 0
-                    diff_resistance = ac_r_avg / params.ac_amplitude if params.ac_amplitude != 0 else np.inf
-                    
-                    # DC resistance
-                    dc_resistance = voltage / dc_current_avg if dc_current_avg != 0 else np.inf
+                    ac_x_avg = ac_x.mean()
+                    ac_y_avg = ac_y.mean()
+                    ac_r_avg = np.hypot(ac_x, ac_y).mean()
+                    ac_phase_avg = np.degrees(np.arctan2(ac_y, ac_x)).mean()
                     
                     # Save data
                     datasaver.add_result(
                         (dc_voltage_param, voltage),
                         (dc_current_param, dc_current_avg),
-                        (self.lockin.amplitude_x, ac_x_avg),
-                        (self.lockin.amplitude_y, ac_y_avg)
+                        (ac_x_param, ac_x_avg),
+                        (ac_y_param, ac_y_avg)
                     )
                     
                     # Store results
-                    results['voltage'].append(voltage)
-                    results['current'].append(dc_current_avg)
-                    results['resistance'].append(dc_resistance)
-                    results['diff_voltage_x'].append(ac_x_avg)
-                    results['diff_voltage_y'].append(ac_y_avg)
-                    results['diff_voltage_r'].append(ac_r_avg)
-                    results['diff_voltage_phase'].append(ac_phase_avg)
-                    results['diff_conductance'].append(diff_conductance)
-                    results['diff_resistance'].append(diff_resistance)
+                    results['current'][n] = dc_current_avg
+                    results['diff_voltage_x'][n] = ac_x_avg
+                    results['diff_voltage_y'][n] = ac_y_avg
+                    results['diff_voltage_r'][n] = ac_r_avg
+                    results['diff_voltage_phase'][n] = ac_phase_avg
                     
-        finally:
-            # Safe shutdown
-            dc_voltage_param(0.0)
-            output_param(False)
+            finally:
+                # Safe shutdown
+                dc_voltage_param(0.0)
+                output_param(False)
+                
+            # The remaining results are committed when the run exits
+            if on_complete is not None:
+                on_complete()
             
-        return {key: np.array(value) for key, value in results.items()}
+        ac_r = results['diff_voltage_r']
+        
+        # Calculate differential conductance (dI/dV)
+        # The lock-in measures dV, we want dI/dV = (dV/R)/dV = 1/R * (dI_ac/dV_ac)
+        # For small signal: dI/dV ≈ I_ac / V_ac
+        diff_conductance = _divide(params.ac_amplitude, ac_r, fill=0.0)
+        diff_resistance = _divide(ac_r, params.ac_amplitude, fill=np.inf)
+        
+        # DC resistance
+        dc_resistance = _divide(voltage_points, results['current'], fill=np.inf)
+        
+        return {
+            'voltage': np.array(voltage_points),
+            'current': results['current'],
+            'resistance': dc_resistance,
+            'diff_voltage_x': results['diff_voltage_x'],
+            'diff_voltage_y': results['diff_voltage_y'],
+            'diff_voltage_r': ac_r,
+            'diff_voltage_phase': results['diff_voltage_phase'],
+            'diff_conductance': diff_conductance,
+            'diff_resistance': diff_resistance
+        }
 
 
 class STSMeasurement:
@@ -211,14 +302,20 @@ class STSMeasurement:
         
     def run_field_sweep(self, diff_params: DifferentialParameters,
                        field_points: List[Tuple[float, float]],
-                       dataset_name: str = "sts_field_sweep") -> Dict[str, np.ndarray]:
+                       dataset_name: str = "sts_field_sweep",
+                       field_settle_time: float = 5.0) -> Dict[str, np.ndarray]:
         """
         Run STS measurements at multiple field points.
         
+        The ramp to the next field is started as soon as a sweep has
+        finished with the bias back at zero, so it runs while the sweep's
+        results are committed to the database.
+        
         Args:
             diff_params: Differential measurement parameters
             field_points: List of (field_x, field_y) tuples
             dataset_name: Dataset name
+            field_settle_time: Settling time after each field ramp in seconds
             
         Returns:
             Dictionary with field-dependent STS data
@@ -233,18 +330,29 @@ class STSMeasurement:
             'diff_resistance_arrays': []
         }
         
-        for field_x, field_y in field_points:
+        if field_points:
+            self.magnet.set_field_vector(*field_points[0], wait_for_completion=False)
+            
+        for index, (field_x, field_y) in enumerate(field_points):
             print(f"STS measurement at field ({field_x:.3f}, {field_y:.3f}) T")
             
-            # Set magnetic field
-            self.magnet.set_field_vector(field_x, field_y, wait_for_completion=True)
+            # Wait for the magnetic field
+            self.magnet.wait_for_ramp_completion()
             
             # Additional settling time for magnetic field
-            time.sleep(5.0)
+            time.sleep(field_settle_time)
+            
+            # Start ramping to the next field while the results are committed
+            next_ramp = None
+            if index + 1 < len(field_points):
+                next_ramp = partial(self.magnet.set_field_vector,
+                                    *field_points[index + 1],
+                                    wait_for_completion=False)
             
             # Run differential conductance measurement
             sts_data = self.diff_measurement.run_sweep(
-                diff_params, f"{dataset_name}_field_{len(all_data['field_x'])}"
+                diff_params, f"{dataset_name}_field_{index}",
+                on_complete=next_ramp
             )
             
             # Store data
@@ -304,37 +412,38 @@ class TwoDeviceDifferential:
         Returns:
             Dictionary with two-device measurement data
         """
-        voltage_points = np.linspace(params.start_voltage, params.stop_voltage, params.num_points)
+        voltage_points = params.voltage_points
         
-        if params.bidirectional:
-            reverse_points = voltage_points[::-1]
-            voltage_points = np.concatenate([voltage_points, reverse_points])
-            
         # Configure lock-in
         self.lockin.frequency(params.frequency)
         self.lockin.amplitude(params.ac_amplitude)
         self.lockin.time_constant(params.time_constant)
         
+        # Parameters used in the measurement loop
+        voltage_a_param = self.smu.voltage_a
+        voltage_b_param = self.smu.voltage_b
+        current_a_param = self.smu.current_a
+        current_b_param = self.smu.current_b
+        ac_x_param = self.lockin.amplitude_x
+        ac_y_param = self.lockin.amplitude_y
+        read_samples = self.lockin.read_samples
+        
         # Set up measurement parameters
         meas = Measurement()
-        meas.register_parameter(self.smu.voltage_a)
-        meas.register_parameter(self.smu.voltage_b)
-        meas.register_parameter(self.smu.current_a, setpoints=(self.smu.voltage_a,))
-        meas.register_parameter(self.smu.current_b, setpoints=(self.smu.voltage_b,))
-        meas.register_parameter(self.lockin.amplitude_x, setpoints=(self.smu.voltage_a, self.smu.voltage_b))
-        meas.register_parameter(self.lockin.amplitude_y, setpoints=(self.smu.voltage_a, self.smu.voltage_b))
-        
+        meas.register_parameter(voltage_a_param)
+        meas.register_parameter(voltage_b_param)
+        meas.register_parameter(current_a_param, setpoints=(voltage_a_param,))
+        meas.register_parameter(current_b_param, setpoints=(voltage_b_param,))
+        meas.register_parameter(ac_x_param, setpoints=(voltage_a_param, voltage_b_param))
+        meas.register_parameter(ac_y_param, setpoints=(voltage_a_param, voltage_b_param))
+        _set_write_period(meas, params, self.lockin)
+        
+        # Measured values; derived quantities are calculated after the sweep
         results = {
-            'voltage_a': [],
-            'voltage_b': [],
-            'current_a': [],
-            'current_b': [],
-            'resistance_a': [],
-            'resistance_b': [],
-            'diff_voltage_x': [],
-            'diff_voltage_y': [],
-            'diff_conductance_a': [],
-            'diff_conductance_b': []
+            'voltage_a': np.array(voltage_points),
+            'voltage_b': voltage_points * voltage_ratio,
+            **{key: np.empty(len(voltage_points), dtype=np.float64)
+               for key in ('current_a', 'current_b', 'diff_voltage_x', 'diff_voltage_y')}
         }
         
         # Enable outputs
@@ -343,65 +452,47 @@ class TwoDeviceDifferential:
         
         try:
             with meas.run() as datasaver:
-                for voltage_a in voltage_points:
-                    voltage_b = voltage_a * voltage_ratio
+                for n, voltage_a in enumerate(voltage_points):
+                    voltage_b = results['voltage_b'][n]
                     
                     # Set DC bias voltages
-                    self.smu.voltage_a(voltage_a)
-                    self.smu.voltage_b(voltage_b)
+                    voltage_a_param(voltage_a)
+                    voltage_b_param(voltage_b)
                     
                     # Wait for settling
-                    time.sleep(params.delay_between_points)
-                    self.lockin.wait_for_settling()
+                    _wait_for_settling(self.lockin, params.delay_between_points)
                     
                     # Take averaged measurements
-                    current_a_measurements = []
-                    current_b_measurements = []
-                    ac_measurements = []
+                    # (average, current A/current B)
+                    currents = np.empty((params.averages, 2), dtype=np.float64)
                     
-                    for _ in range(params.averages):
-                        current_a_measurements.append(self.smu.current_a())
-                        current_b_measurements.append(self.smu.current_b())
-                        ac_measurements.append(self.lockin.measure_with_averaging(1))
-                        time.sleep(0.05)
+                    for i in range(params.averages):
+                        currents[i] = (current_a_param(), current_b_param())
+                        if params.inter_average_delay:
+                            time.sleep(params.inter_average_delay)
                         
-                    # Calculate averages
-                    current_a_avg = np.mean(current_a_measurements)
-                    current_b_avg = np.mean(current_b_measurements)
-                    
-                    ac_x_avg = np.mean([m['x'] for m in ac_measurements])
-                    ac_y_avg = np.mean([m['y'] for m in ac_measurements])
+                    # One burst of fundamental X/Y samples
+                    ac_samples = read_samples(params.averages)[:, 0]
                     
-                    # Calculate resistances
-                    resistance_a = voltage_a / current_a_avg if current_a_avg != 0 else np.inf
-                    resistance_b = voltage_b / current_b_avg if current_b_avg != 0 else np.inf
-                    
-                    # Estimate differential conductances
-                    # This is simplified - in practice would need separate lock-in channels
-                    diff_cond_a = params.ac_amplitude / np.sqrt(ac_x_avg**2 + ac_y_avg**2) if ac_x_avg != 0 or ac_y_avg != 0 else 0
-                    diff_cond_b = diff_cond_a * (resistance_a / resistance_b) if resistance_b != 0 else 0
+                    # Calculate averages
+                    current_a_avg, current_b_avg = currents.mean(axis=0)
+                    ac_x_avg, ac_y_avg = ac_samples.mean(axis=0)
                     
                     # Save data
                     datasaver.add_result(
-                        (self.smu.voltage_a, voltage_a),
-                        (self.smu.voltage_b, voltage_b),
-                        (self.smu.current_a, current_a_avg),
-                        (self.smu.current_b, current_b_avg),
-                        (self.lockin.amplitude_x, ac_x_avg),
-                        (self.lockin.amplitude_y, ac_y_avg)
+                        (voltage_a_param, voltage_a),
+                        (voltage_b_param, voltage_b),
+                        (current_a_param, current_a_avg),
+                        (current_b_param, current_b_avg),
+                        (ac_x_param, ac_x_avg),
+                        (ac_y_param, ac_y_avg)
                     )
                     
                     # Store results
-                    results['voltage_a'].append(voltage_a)
-                    results['voltage_b'].append(voltage_b)
-                    results['current_a'].append(current_a_avg)
-                    results['current_b'].append(current_b_avg)
-                    results['resistance_a'].append(resistance_a)
-                    results['resistance_b'].append(resistance_b)
-                    results['diff_voltage_x'].append(ac_x_avg)
-                    results['diff_voltage_y'].append(ac_y_avg)
-                    results['diff_conductance_a'].append(diff_cond_a)
-                    results['diff_conductance_b'].append(diff_cond_b)
+                    results['current_a'][n] = current_a_avg
+                    results['current_b'][n] = current_b_avg
+                    results['diff_voltage_x'][n] = ac_x_avg
+                    results['diff_voltage_y'][n] = ac_y_avg
                     
         finally:
             # Safe shutdown
@@ -410,7 +501,58 @@ class TwoDeviceDifferential:
             self.smu.output_a(False)
             self.smu.output_b(False)
             
-        return {key: np.array(value) for key, value in results.items()}
+        # Calculate resistances
+        resistance_a = _divide(results['voltage_a'], results['current_a'], fill=np.inf)
+        resistance_b = _divide(results['voltage_b'], results['current_b'], fill=np.inf)
+        
+        # Estimate differential conductances
+        # This is simplified - in practice would need separate lock-in channels
+        ac_r = np.hypot(results['diff_voltage_x'], results['diff_voltage_y'])
+        diff_cond_a = _divide(params.ac_amplitude, ac_r, fill=0.0)
+        diff_cond_b = diff_cond_a * _divide(resistance_a, resistance_b, fill=0.0)
+        
+        return {
+            'voltage_a': results['voltage_a'],
+            'voltage_b': results['voltage_b'],
+            'current_a': results['current_a'],
+            'current_b': results['current_b'],
+            'resistance_a': resistance_a,
+            'resistance_b': resistance_b,
+            'diff_voltage_x': results['diff_voltage_x'],
+            'diff_voltage_y': results['diff_voltage_y'],
+            'diff_conductance_a': diff_cond_a,
+            'diff_conductance_b': diff_cond_b
+        }
+
+
+def _harmonic_quantities(raw: np.ndarray, ac_amplitude: float) -> Dict[str, np.ndarray]:
+    """
+    Reduce raw harmonic readings of a whole sweep in one vectorized pass.
+    
+    Args:
+        raw: Lock-in readings of shape (point, average, harmonic, X/Y) for
+             the fundamental, 2w and 3w
+        ac_amplitude: AC modulation amplitude in V
+        
+    Returns:
+        Averaged X/Y per harmonic, fundamental conductance and 2w/3w amplitudes
+    """
+    means = raw.mean(axis=1)  # (point, harmonic, X/Y)
+    x = means[..., 0]
+    y = means[..., 1]
+    amplitude = np.hypot(x, y)
+    
+    return {
+        'fundamental_x': x[:, 0],
+        'fundamental_y': y[:, 0],
+        'harmonic_2w_x': x[:, 1],
+        'harmonic_2w_y': y[:, 1],
+        'harmonic_3w_x': x[:, 2],
+        'harmonic_3w_y': y[:, 2],
+        'fundamental_conductance': ac_amplitude / amplitude[:, 0],
+        'harmonic_2w_amplitude': amplitude[:, 1],
+        'harmonic_3w_amplitude': amplitude[:, 2]
+    }
 
 
 class HarmonicDifferentialMeasurement:
@@ -449,12 +591,8 @@ class HarmonicDifferentialMeasurement:
         Returns:
             Dictionary with harmonic measurement data
         """
-        voltage_points = np.linspace(params.start_voltage, params.stop_voltage, params.num_points)
+        voltage_points = params.voltage_points
         
-        if params.bidirectional:
-            reverse_points = voltage_points[::-1]
-            voltage_points = np.concatenate([voltage_points, reverse_points])
-            
         # Configure lock-in for harmonic measurements
         self.lockin.frequency(params.frequency)
         self.lockin.amplitude(params.ac_amplitude)
@@ -464,78 +602,32 @@ class HarmonicDifferentialMeasurement:
         # Configure SMU
         dc_voltage_param = getattr(self.smu, f'voltage_{self.smu_channel}')
         output_param = getattr(self.smu, f'output_{self.smu_channel}')
+        read_samples = self.lockin.read_samples
         
         self.smu.configure_voltage_source(self.smu_channel)
         self.smu.set_compliance(self.smu_channel, current_limit=1e-6)
         
-        results = {
-            'voltage': [],
-            'fundamental_x': [],
-            'fundamental_y': [],
-            'harmonic_2w_x': [],
-            'harmonic_2w_y': [],
-            'harmonic_3w_x': [],
-            'harmonic_3w_y': [],
-            'fundamental_conductance': [],
-            'harmonic_2w_amplitude': [],
-            'harmonic_3w_amplitude': []
-        }
+        # Raw lock-in readings: (point, average, harmonic, X/Y); reduced
+        # after the sweep
+        raw = np.empty((len(voltage_points), params.averages, 3, 2))
         
         output_param(True)
         
         try:
-            for voltage in voltage_points:
+            for n, voltage in enumerate(voltage_points):
                 dc_voltage_param(voltage)
                 
                 # Wait for settling
-                time.sleep(params.delay_between_points)
-                self.lockin.wait_for_settling()
+                _wait_for_settling(self.lockin, params.delay_between_points)
                 
-                # Measure all harmonics
-                fund_x_avg = 0
-                fund_y_avg = 0
-                h2w_x_avg = 0
-                h2w_y_avg = 0
-                h3w_x_avg = 0
-                h3w_y_avg = 0
-                
-                for _ in range(params.averages):
-                    fund_x_avg += self.lockin.amplitude_x()
-                    fund_y_avg += self.lockin.amplitude_y()
-                    h2w_x_avg += self.lockin.harmonic_2w_x()
-                    h2w_y_avg += self.lockin.harmonic_2w_y()
-                    h3w_x_avg += self.lockin.harmonic_3w_x()
-                    h3w_y_avg += self.lockin.harmonic_3w_y()
-                    time.sleep(0.05)
+                # Measure all harmonics in one burst of samples
+                raw[n] = read_samples(params.averages)
                     
-                # Calculate averages
-                fund_x_avg /= params.averages
-                fund_y_avg /= params.averages
-                h2w_x_avg /= params.averages
-                h2w_y_avg /= params.averages
-                h3w_x_avg /= params.averages
-                h3w_y_avg /= params.averages
-                
-                # Calculate conductances and amplitudes
-                fund_conductance = params.ac_amplitude / np.sqrt(fund_x_avg**2 + fund_y_avg**2)
-                h2w_amplitude = np.sqrt(h2w_x_avg**2 + h2w_y_avg**2)
-                h3w_amplitude = np.sqrt(h3w_x_avg**2 + h3w_y_avg**2)
-                
-                # Store results
-                results['voltage'].append(voltage)
-                results['fundamental_x'].append(fund_x_avg)
-                results['fundamental_y'].append(fund_y_avg)
-                results['harmonic_2w_x'].append(h2w_x_avg)
-                results['harmonic_2w_y'].append(h2w_y_avg)
-                results['harmonic_3w_x'].append(h3w_x_avg)
-                results['harmonic_3w_y'].append(h3w_y_avg)
-                results['fundamental_conductance'].append(fund_conductance)
-                results['harmonic_2w_amplitude'].append(h2w_amplitude)
-                results['harmonic_3w_amplitude'].append(h3w_amplitude)
-                
         finally:
             # Safe shutdown
             dc_voltage_param(0.0)
             output_param(False)
             
-        return {key: np.array(value) for key, value in results.items()}
\ No newline at end of file
+        # Calculate averages, conductances and amplitudes
+        return {'voltage': np.array(voltage_points),
+                **_harmonic_quantities(raw, params.ac_amplitude)}
\ No newline at end of file
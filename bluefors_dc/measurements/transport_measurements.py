@@ -147,7 +147,8 @@ class HallMeasurement:
                 else:
                     # DC measurement
                     voltage = self.nanovoltmeter.take_measurement(5)  # 5-point average
-                    current = self.current_source.current()
+                    # Setpoint from the parameter cache; no read-back query
+                    current = self.current_source.current.get_latest()
                     resistance = voltage / current if current != 0 else np.inf
                     
                     results['voltage_xx'].append(voltage)
@@ -216,7 +217,8 @@ class TransportMeasurement:
         elif hasattr(self, 'current_source'):
             # DC measurement with separate instruments
             voltage = self.nanovoltmeter.take_measurement(averages)
-            current = self.current_source.current()
+            # Setpoint from the parameter cache; no read-back query
+            current = self.current_source.current.get_latest()
             resistance = voltage / current if current != 0 else np.inf
             return resistance, voltage, current
             
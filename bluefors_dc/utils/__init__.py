@@ -3,7 +3,9 @@ Utility functions and helper classes for Bluefors DC measurements.
 """
 
 from .safety import SafetyChecks
+from .concurrency import read_parallel
 
 __all__ = [
-    'SafetyChecks'
+    'SafetyChecks',
+    'read_parallel'
 ]
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Concurrent instrument access helpers.
+
+Instruments on different VISA sessions can be read in parallel from a
+thread pool; wall-clock time is then bounded by the slowest instrument
+instead of the sum of all round-trips.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+def read_parallel(getters: Dict[str, Callable[[], Any]],
+                  max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Call several instrument getters concurrently.
+    
+    Each getter should talk to a different instrument; getters of the same
+    instrument are safe only if its driver serializes I/O (the Keithley
+    drivers do) and gain nothing from running in parallel.
+    
+    Args:
+        getters: Mapping of result name to zero-argument callable, e.g.
+                 {'voltage': nvm.voltage, 'current': source.source_current}
+        max_workers: Thread pool size (default: one thread per getter)
+        
+    Returns:
+        Dictionary mapping each name to its getter's result
+        
+    Raises:
+        Exception: The first exception raised by any getter
+    """
+    if not getters:
+        return {}
+    workers = max_workers or len(getters)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {name: pool.submit(getter) for name, getter in getters.items()}
+        return {name: future.result() for name, future in futures.items()}
@@ -9,7 +9,7 @@ from unittest.mock import Mock, MagicMock, patch
 
 from bluefors_dc.instruments import AMI430MagnetController, Keithley6221, Keithley2182A
 from bluefors_dc.measurements import BlueforsStation
-from bluefors_dc.utils import SafetyChecks
+from bluefors_dc.utils import SafetyChecks, read_parallel
 
 
 class TestSafetyChecks:
@@ -69,6 +69,25 @@ class TestSafetyChecks:
         assert safety.check_sweep_parameters(unsafe_params) == False
 
 
+class TestConcurrency:
+    """Test concurrent instrument access helpers."""
+    
+    def test_read_parallel(self):
+        """Test that getters run concurrently and results keep their names."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def getter(value):
+            def get():
+                barrier.wait()  # Deadlocks (times out) unless run in parallel
+                return value
+            return get
+            
+        result = read_parallel({'voltage': getter(1e-6), 'current': getter(2e-9)})
+        assert result == {'voltage': 1e-6, 'current': 2e-9}
+        assert read_parallel({}) == {}
+
+
 class TestInstrumentDrivers:
     """Test instrument driver basic functionality."""
     
@@ -89,9 +108,8 @@ class TestInstrumentDrivers:
             with patch('bluefors_dc.instruments.ami430.VisaInstrument'):
                 magnet = AMI430MagnetController('test_magnet', 'MOCK::ADDRESS')
                 
-                # Mock field readings
-                magnet.field_x = Mock(return_value=3.0)
-                magnet.field_y = Mock(return_value=4.0)
+                # Mock the compound X/Y field query
+                magnet.ask = Mock(return_value='3.0;4.0')
                 
                 # Test magnitude calculation
                 magnitude = magnet._get_field_magnitude()
@@ -129,6 +147,87 @@ class TestInstrumentDrivers:
                 with pytest.raises(ValueError):
                     magnet.set_field_polar(15.0, 45.0, wait_for_completion=False)
 
+    def test_magnet_emergency_stop_in_batch(self):
+        """Test that emergency_stop() writes PAUSE even inside batched_write()."""
+        from bluefors_dc.instruments.ami430 import AMI430MagnetController as CustomAMI430
+
+        magnet = CustomAMI430('test_magnet_estop', 'GPIB::1::INSTR',
+                              pyvisa_sim_file='qcodes.instrument.sims:AMI430.yaml')
+        try:
+            magnet.visa_handle.write = Mock()
+            with magnet.batched_write():
+                magnet.write('CONF:FIELD:MAG:X 1.000000')
+                magnet.emergency_stop()
+            # PAUSE is sent at once and the pending batch is dropped
+            magnet.visa_handle.write.assert_called_once_with('PAUSE')
+        finally:
+            magnet.close()
+
+    def test_deduplicating_parameter(self):
+        """Test that repeated setpoints are written only once."""
+        from bluefors_dc.instruments.keithley import DeduplicatingParameter, Keithley2636B
+
+        write = Mock()
+        level = DeduplicatingParameter('level', set_cmd=write)
+
+        # Repeated values are skipped, changes are written
+        level(1.0)
+        level(1.0)
+        level(2.0)
+        assert [c.args[0] for c in write.call_args_list] == [1.0, 2.0]
+
+        # Forgotten setpoints are written again
+        level.forget_setpoint()
+        level(2.0)
+        assert write.call_count == 3
+
+        # reset() forgets the setpoints of the instrument's parameters
+        instrument = Mock(parameters={'level': level})
+        Keithley2636B.reset(instrument)
+        instrument.ask.assert_called_once()
+        level(2.0)
+        assert write.call_count == 4
+
+    def test_lakeshore_chained_channel_queries(self):
+        """Test chaining, error handling and cool-down of all-channel reads."""
+        from pyvisa import VisaIOError, constants
+        from bluefors_dc.instruments.lakeshore import Lakeshore372
+
+        lakeshore = Lakeshore372(
+            'test_lakeshore', 'GPIB::3::INSTR', lazy_connect=True,
+            pyvisa_sim_file='qcodes.instrument.sims:lakeshore_model372.yaml')
+        try:
+            # 16 channels in 3 messages of at most 64 characters
+            lakeshore.ask = Mock(side_effect=lambda cmd: ';'.join(
+                '1.5' for _ in cmd.split(';')))
+            readings = lakeshore._query_all_channels('KRDG?')
+            messages = [c.args[0] for c in lakeshore.ask.call_args_list]
+            assert len(messages) == 3
+            assert all(len(message) <= 64 for message in messages)
+            assert readings == {i: 1.5 for i in range(1, 17)}
+            assert lakeshore.channel_errors == {}
+
+            # A short reply gives NaN and an error for the missing channel
+            lakeshore.ask = Mock(return_value='1.5;2.5')
+            readings = lakeshore._query_all_channels('KRDG?', channels=[1, 2, 3])
+            assert readings[1] == 1.5 and readings[2] == 2.5
+            assert np.isnan(readings[3])
+            assert list(lakeshore.channel_errors) == [3]
+
+            # Three failed messages put the channels into cool-down
+            lakeshore.ask = Mock(side_effect=VisaIOError(
+                constants.StatusCode.error_timeout))
+            for _ in range(3):
+                readings = lakeshore._query_all_channels('KRDG?', channels=[4])
+                assert np.isnan(readings[4])
+            assert lakeshore.ask.call_count == 3
+            assert isinstance(lakeshore.channel_errors[4], VisaIOError)
+            readings = lakeshore._query_all_channels('KRDG?', channels=[4])
+            assert np.isnan(readings[4])
+            assert lakeshore.ask.call_count == 3
+        finally:
+            lakeshore.close()
+
 
 class TestMeasurementProtocols:
     """Test measurement protocol classes."""